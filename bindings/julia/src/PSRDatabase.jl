@@ -23,9 +23,9 @@ function find_library()
     ]
 
     for path in search_paths
-        libpath = joinpath(path, LIBNAME * (Sys.iswindows() ? ".dll" : ".so"))
-        if isfile(libpath)
-            return libpath
+        candidate = joinpath(path, LIBNAME * (Sys.iswindows() ? ".dll" : ".so"))
+        if isfile(candidate)
+            return candidate
         end
     end
 
@@ -33,10 +33,14 @@ function find_library()
     return LIBNAME
 end
 
-const LIBPATH = Ref{String}()
+const LIBPATH = Ref{String}("")
 
-function __init__()
-    LIBPATH[] = find_library()
+# Resolve the library path on first use rather than at module load
+function libpath()
+    if isempty(LIBPATH[])
+        LIBPATH[] = find_library()
+    end
+    return LIBPATH[]
 end
 
 # Error codes from C API
@@ -73,7 +77,7 @@ Base.showerror(io::IO, e::DatabaseException) = print(io, "DatabaseException: ",
 function check_error(error_code::Cint, db::Ptr{Cvoid}=C_NULL)
     if error_code != PSR_OK
         if db != C_NULL
-            msg_ptr = ccall((:psr_database_error_message, LIBPATH[]), Cstring, (Ptr{Cvoid},), db)
+            msg_ptr = ccall((:psr_database_error_message, libpath()), Cstring, (Ptr{Cvoid},), db)
             if msg_ptr != C_NULL
                 msg = unsafe_string(msg_ptr)
                 if !isempty(msg)
@@ -94,7 +98,7 @@ mutable struct Database
         db = new(handle, path)
         finalizer(db) do d
             if d.handle != C_NULL
-                ccall((:psr_database_close, LIBPATH[]), Cvoid, (Ptr{Cvoid},), d.handle)
+                ccall((:psr_database_close, libpath()), Cvoid, (Ptr{Cvoid},), d.handle)
                 d.handle = C_NULL
             end
         end
@@ -108,17 +112,18 @@ function Base.show(io::IO, db::Database)
 end
 
 """
-    open_database(path::String; log_level=PSR_LOG_OFF) -> Database
+    open_database(path::String; log_level=PSR_LOG_OFF, performance_pragmas=true) -> Database
 
 Open an existing SQLite database.
+With `performance_pragmas=false` the file keeps its journal mode instead of being switched to WAL.
 """
-function open_database(path::String; log_level::Cint=PSR_LOG_OFF)
+function open_database(path::String; log_level::Cint=PSR_LOG_OFF, performance_pragmas::Bool=true)
     error_ref = Ref{Cint}(PSR_OK)
     handle = ccall(
-        (:psr_database_open, LIBPATH[]),
+        (:psr_database_open_ex, libpath()),
         Ptr{Cvoid},
-        (Cstring, Cint, Ptr{Cint}),
-        path, log_level, error_ref
+        (Cstring, Cint, Cint, Ptr{Cint}),
+        path, log_level, performance_pragmas, error_ref
     )
     if handle == C_NULL
         throw(DatabaseException("Failed to open database: $path"))
@@ -127,7 +132,7 @@ function open_database(path::String; log_level::Cint=PSR_LOG_OFF)
 end
 
 """
-    create_empty_db_from_schema(db_path::String, schema_path::String; force::Bool=false, log_level=PSR_LOG_OFF) -> Database
+    create_empty_db_from_schema(db_path::String, schema_path::String; force::Bool=false, log_level=PSR_LOG_OFF, performance_pragmas=true) -> Database
 
 Create a new database from a SQL schema file.
 If `force=true`, delete existing database file first.
@@ -136,7 +141,8 @@ function create_empty_db_from_schema(
     db_path::String,
     schema_path::String;
     force::Bool=false,
-    log_level::Cint=PSR_LOG_OFF
+    log_level::Cint=PSR_LOG_OFF,
+    performance_pragmas::Bool=true
 )
     if force && isfile(db_path)
         # On Windows, SQLite files can remain locked briefly after closing
@@ -167,7 +173,7 @@ function create_empty_db_from_schema(
     schema_sql = read(schema_path, String)
 
     # Create empty database
-    db = open_database(db_path; log_level=log_level)
+    db = open_database(db_path; log_level=log_level, performance_pragmas=performance_pragmas)
 
     # Execute schema statements
     try
@@ -239,7 +245,7 @@ Close the database connection.
 """
 function close!(db::Database)
     if db.handle != C_NULL
-        ccall((:psr_database_close, LIBPATH[]), Cvoid, (Ptr{Cvoid},), db.handle)
+        ccall((:psr_database_close, libpath()), Cvoid, (Ptr{Cvoid},), db.handle)
         db.handle = C_NULL
     end
     return nothing
@@ -253,14 +259,14 @@ Execute a SQL statement.
 function execute(db::Database, sql::AbstractString)
     error_ref = Ref{Cint}(PSR_OK)
     result = ccall(
-        (:psr_database_execute, LIBPATH[]),
+        (:psr_database_execute, libpath()),
         Ptr{Cvoid},
         (Ptr{Cvoid}, Cstring, Ptr{Cint}),
         db.handle, sql, error_ref
     )
     check_error(error_ref[], db.handle)
     if result != C_NULL
-        ccall((:psr_result_free, LIBPATH[]), Cvoid, (Ptr{Cvoid},), result)
+        ccall((:psr_result_free, libpath()), Cvoid, (Ptr{Cvoid},), result)
     end
     return nothing
 end
@@ -271,16 +277,16 @@ end
 Execute function `f` within a database transaction.
 """
 function transaction(f::Function, db::Database)
-    error_ref = ccall((:psr_database_begin_transaction, LIBPATH[]), Cint, (Ptr{Cvoid},), db.handle)
+    error_ref = ccall((:psr_database_begin_transaction, libpath()), Cint, (Ptr{Cvoid},), db.handle)
     check_error(error_ref, db.handle)
 
     try
         result = f()
-        error_ref = ccall((:psr_database_commit, LIBPATH[]), Cint, (Ptr{Cvoid},), db.handle)
+        error_ref = ccall((:psr_database_commit, libpath()), Cint, (Ptr{Cvoid},), db.handle)
         check_error(error_ref, db.handle)
         return result
     catch e
-        ccall((:psr_database_rollback, LIBPATH[]), Cint, (Ptr{Cvoid},), db.handle)
+        ccall((:psr_database_rollback, libpath()), Cint, (Ptr{Cvoid},), db.handle)
         rethrow()
     end
 end
@@ -293,7 +299,7 @@ Look up an element ID by its label.
 function get_element_id(db::Database, collection::String, label::String)
     error_ref = Ref{Cint}(PSR_OK)
     id = ccall(
-        (:psr_database_get_element_id, LIBPATH[]),
+        (:psr_database_get_element_id, libpath()),
         Int64,
         (Ptr{Cvoid}, Cstring, Cstring, Ptr{Cint}),
         db.handle, collection, label, error_ref
@@ -307,14 +313,14 @@ mutable struct ElementBuilder
     handle::Ptr{Cvoid}
 
     function ElementBuilder()
-        handle = ccall((:psr_element_create, LIBPATH[]), Ptr{Cvoid}, ())
+        handle = ccall((:psr_element_create, libpath()), Ptr{Cvoid}, ())
         if handle == C_NULL
             throw(DatabaseException("Failed to create element builder"))
         end
         builder = new(handle)
         finalizer(builder) do b
             if b.handle != C_NULL
-                ccall((:psr_element_free, LIBPATH[]), Cvoid, (Ptr{Cvoid},), b.handle)
+                ccall((:psr_element_free, libpath()), Cvoid, (Ptr{Cvoid},), b.handle)
                 b.handle = C_NULL
             end
         end
@@ -327,14 +333,14 @@ mutable struct TimeSeriesBuilder
     handle::Ptr{Cvoid}
 
     function TimeSeriesBuilder()
-        handle = ccall((:psr_time_series_create, LIBPATH[]), Ptr{Cvoid}, ())
+        handle = ccall((:psr_time_series_create, libpath()), Ptr{Cvoid}, ())
         if handle == C_NULL
             throw(DatabaseException("Failed to create time series builder"))
         end
         builder = new(handle)
         finalizer(builder) do b
             if b.handle != C_NULL
-                ccall((:psr_time_series_free, LIBPATH[]), Cvoid, (Ptr{Cvoid},), b.handle)
+                ccall((:psr_time_series_free, libpath()), Cvoid, (Ptr{Cvoid},), b.handle)
                 b.handle = C_NULL
             end
         end
@@ -345,7 +351,7 @@ end
 # Set scalar values on element
 function element_set!(builder::ElementBuilder, column::String, value::Nothing)
     error_ref = ccall(
-        (:psr_element_set_null, LIBPATH[]),
+        (:psr_element_set_null, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring),
         builder.handle, column
@@ -359,7 +365,7 @@ end
 
 function element_set!(builder::ElementBuilder, column::String, value::Integer)
     error_ref = ccall(
-        (:psr_element_set_int, LIBPATH[]),
+        (:psr_element_set_int, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Int64),
         builder.handle, column, Int64(value)
@@ -369,7 +375,7 @@ end
 
 function element_set!(builder::ElementBuilder, column::String, value::AbstractFloat)
     error_ref = ccall(
-        (:psr_element_set_double, LIBPATH[]),
+        (:psr_element_set_double, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Float64),
         builder.handle, column, Float64(value)
@@ -383,7 +389,7 @@ function element_set!(builder::ElementBuilder, column::String, value::AbstractSt
         validate_date_string(column, value)
     end
     error_ref = ccall(
-        (:psr_element_set_string, LIBPATH[]),
+        (:psr_element_set_string, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Cstring),
         builder.handle, column, value
@@ -435,7 +441,7 @@ function element_set!(builder::ElementBuilder, column::String, values::AbstractV
     end
     int_values = Int64.(values)
     error_ref = ccall(
-        (:psr_element_set_int_array, LIBPATH[]),
+        (:psr_element_set_int_array, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Ptr{Int64}, Csize_t),
         builder.handle, column, int_values, length(int_values)
@@ -457,7 +463,7 @@ function element_set!(builder::ElementBuilder, column::String, values::AbstractV
         end
     end
     error_ref = ccall(
-        (:psr_element_set_double_array, LIBPATH[]),
+        (:psr_element_set_double_array, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Ptr{Float64}, Csize_t),
         builder.handle, column, float_values, length(float_values)
@@ -478,7 +484,7 @@ function element_set!(builder::ElementBuilder, column::String, values::AbstractV
         end
     end
     error_ref = ccall(
-        (:psr_element_set_double_array, LIBPATH[]),
+        (:psr_element_set_double_array, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Ptr{Float64}, Csize_t),
         builder.handle, column, float_values, length(float_values)
@@ -497,7 +503,7 @@ function element_set!(builder::ElementBuilder, column::String, values::AbstractV
             cstrings[i] = Base.unsafe_convert(Cstring, values[i])
         end
         error_ref = ccall(
-            (:psr_element_set_string_array, LIBPATH[]),
+            (:psr_element_set_string_array, libpath()),
             Cint,
             (Ptr{Cvoid}, Cstring, Ptr{Cstring}, Csize_t),
             builder.handle, column, cstrings, length(cstrings)
@@ -528,7 +534,7 @@ end
 function time_series_add_column!(ts::TimeSeriesBuilder, name::String, values::AbstractVector{<:Integer})
     int_values = Int64.(values)
     error_ref = ccall(
-        (:psr_time_series_add_int_column, LIBPATH[]),
+        (:psr_time_series_add_int_column, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Ptr{Int64}, Csize_t),
         ts.handle, name, int_values, length(int_values)
@@ -546,7 +552,7 @@ function time_series_add_column!(ts::TimeSeriesBuilder, name::String, values::Ab
         end
     end
     error_ref = ccall(
-        (:psr_time_series_add_double_column, LIBPATH[]),
+        (:psr_time_series_add_double_column, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Ptr{Float64}, Csize_t),
         ts.handle, name, float_values, length(float_values)
@@ -564,7 +570,7 @@ function time_series_add_column!(ts::TimeSeriesBuilder, name::String, values::Ab
         end
     end
     error_ref = ccall(
-        (:psr_time_series_add_double_column, LIBPATH[]),
+        (:psr_time_series_add_double_column, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Ptr{Float64}, Csize_t),
         ts.handle, name, float_values, length(float_values)
@@ -579,7 +585,7 @@ function time_series_add_column!(ts::TimeSeriesBuilder, name::String, values::Ab
             cstrings[i] = Base.unsafe_convert(Cstring, values[i])
         end
         error_ref = ccall(
-            (:psr_time_series_add_string_column, LIBPATH[]),
+            (:psr_time_series_add_string_column, libpath()),
             Cint,
             (Ptr{Cvoid}, Cstring, Ptr{Cstring}, Csize_t),
             ts.handle, name, cstrings, length(cstrings)
@@ -595,7 +601,7 @@ end
 
 function element_add_time_series!(builder::ElementBuilder, group::String, ts::TimeSeriesBuilder)
     error_ref = ccall(
-        (:psr_element_add_time_series, LIBPATH[]),
+        (:psr_element_add_time_series, libpath()),
         Cint,
         (Ptr{Cvoid}, Cstring, Ptr{Cvoid}),
         builder.handle, group, ts.handle
@@ -661,7 +667,7 @@ function create_element!(db::Database, table::String; kwargs...)
 
     error_ref = Ref{Cint}(PSR_OK)
     id = ccall(
-        (:psr_database_create_element, LIBPATH[]),
+        (:psr_database_create_element, libpath()),
         Int64,
         (Ptr{Cvoid}, Cstring, Ptr{Cvoid}, Ptr{Cint}),
         db.handle, table, builder.handle, error_ref
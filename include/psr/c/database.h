@@ -50,9 +50,19 @@ typedef struct psr_time_series psr_time_series_t;
 PSR_C_API psr_database_t* psr_database_open(const char* path, psr_log_level_t console_level, psr_error_t* error);
 PSR_C_API psr_database_t* psr_database_from_schema(const char* db_path, const char* schema_path,
                                                    psr_log_level_t console_level, psr_error_t* error);
+// The _ex variants take performance_pragmas (0 to opt out); the plain ones enable it. It switches file databases to
+// WAL journal mode, which persists in the file, and sets mmap I/O and a 64 MiB page cache for the connection.
+PSR_C_API psr_database_t* psr_database_open_ex(const char* path, psr_log_level_t console_level, int performance_pragmas,
+                                               psr_error_t* error);
+PSR_C_API psr_database_t* psr_database_from_schema_ex(const char* db_path, const char* schema_path,
+                                                      psr_log_level_t console_level, int performance_pragmas,
+                                                      psr_error_t* error);
 PSR_C_API void psr_database_close(psr_database_t* db);
 PSR_C_API int psr_database_is_open(psr_database_t* db);
 PSR_C_API psr_result_t* psr_database_execute(psr_database_t* db, const char* sql, psr_error_t* error);
+PSR_C_API psr_result_t* psr_database_execute_uncached(psr_database_t* db, const char* sql, psr_error_t* error);
+// Opt-in cache of read-only query results; cleared by any write, schema or connection statement on this handle
+PSR_C_API psr_error_t psr_database_enable_query_cache(psr_database_t* db, int enabled);
 PSR_C_API int64_t psr_database_last_insert_rowid(psr_database_t* db);
 PSR_C_API int psr_database_changes(psr_database_t* db);
 PSR_C_API psr_error_t psr_database_begin_transaction(psr_database_t* db);
@@ -16,11 +16,23 @@ typedef enum {
     PSR_TYPE_BLOB = 4,
 } psr_value_type_t;
 
+// Single cell value; string and blob pointers remain valid until the result is freed
+typedef struct {
+    psr_value_type_t type;
+    int64_t int_value;
+    double double_value;
+    const char* string_value;
+    const uint8_t* blob_value;
+    size_t blob_size;
+} psr_value_t;
+
 // Result functions
 PSR_C_API void psr_result_free(psr_result_t* result);
 PSR_C_API size_t psr_result_row_count(psr_result_t* result);
 PSR_C_API size_t psr_result_column_count(psr_result_t* result);
 PSR_C_API const char* psr_result_column_name(psr_result_t* result, size_t col);
+PSR_C_API int64_t psr_result_last_insert_rowid(psr_result_t* result);
+PSR_C_API int64_t psr_result_changes(psr_result_t* result);
 PSR_C_API psr_value_type_t psr_result_get_type(psr_result_t* result, size_t row, size_t col);
 PSR_C_API int psr_result_is_null(psr_result_t* result, size_t row, size_t col);
 PSR_C_API psr_error_t psr_result_get_int(psr_result_t* result, size_t row, size_t col, int64_t* value);
@@ -28,6 +40,15 @@ PSR_C_API psr_error_t psr_result_get_double(psr_result_t* result, size_t row, si
 PSR_C_API const char* psr_result_get_string(psr_result_t* result, size_t row, size_t col);
 PSR_C_API const uint8_t* psr_result_get_blob(psr_result_t* result, size_t row, size_t col, size_t* size);
 
+// Bulk access: fills values (row-major, row_count * column_count cells) in a single call
+PSR_C_API psr_error_t psr_result_fetch_all(psr_result_t* result, psr_value_t* values, size_t count);
+
+// Columnar access: fills row_count contiguous values for one column; nulls (optional) receives 1 for NULL cells
+PSR_C_API psr_error_t psr_result_get_int_column(psr_result_t* result, size_t col, int64_t* values, uint8_t* nulls,
+                                                size_t count);
+PSR_C_API psr_error_t psr_result_get_double_column(psr_result_t* result, size_t col, double* values, uint8_t* nulls,
+                                                   size_t count);
+
 #ifdef __cplusplus
 }
 #endif
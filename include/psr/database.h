@@ -7,6 +7,7 @@
 #include <cstdint>
 #include <map>
 #include <memory>
+#include <optional>
 #include <string>
 #include <utility>
 #include <vector>
@@ -17,14 +18,46 @@ namespace psr {
 
 enum class LogLevel { debug, info, warn, error, off };
 
+// Steps a query lazily, one row per next() call, instead of materializing a Result.
+// Holds one of its Database's statements until exhausted or destroyed, so it must not outlive the Database
+// (or be used after close(); destroying it after close() is fine and lets the connection finish closing).
+class PSR_API ResultIterator {
+public:
+    ~ResultIterator();
+
+    // Non-copyable
+    ResultIterator(const ResultIterator&) = delete;
+    ResultIterator& operator=(const ResultIterator&) = delete;
+
+    // Movable
+    ResultIterator(ResultIterator&& other) noexcept;
+    ResultIterator& operator=(ResultIterator&& other) noexcept;
+
+    const std::vector<std::string>& columns() const;
+
+    // Returns the next row, or std::nullopt once the query is exhausted
+    std::optional<Row> next();
+
+private:
+    friend class Database;
+    struct Impl;
+    explicit ResultIterator(std::unique_ptr<Impl> impl);
+    std::unique_ptr<Impl> impl_;
+};
+
+// A Database caches prepared statements without locking, so it must not be used by more than one thread at a
+// time; separate instances may run concurrently.
 class PSR_API Database {
 public:
-    explicit Database(const std::string& path, LogLevel console_level = LogLevel::info);
+    // performance_pragmas enables WAL, mmap I/O and a 64 MiB page cache on open, plus synchronous=NORMAL once WAL
+    // is in effect
+    explicit Database(const std::string& path, LogLevel console_level = LogLevel::info,
+                      bool performance_pragmas = true);
     ~Database();
 
     // Factory method for schema-based initialization
     static Database from_schema(const std::string& database_path, const std::string& schema_path,
-                                LogLevel console_level = LogLevel::info);
+                                LogLevel console_level = LogLevel::info, bool performance_pragmas = true);
 
     // Non-copyable
     Database(const Database&) = delete;
@@ -40,6 +73,24 @@ public:
     Result execute(const std::string& sql);
     Result execute(const std::string& sql, const std::vector<Value>& params);
 
+    // Prepare, run and finalize without the statement cache (for one-shot queries)
+    Result execute_uncached(const std::string& sql);
+    Result execute_uncached(const std::string& sql, const std::vector<Value>& params);
+
+    // Stream rows one at a time with constant memory (see ResultIterator)
+    ResultIterator iter_execute(const std::string& sql);
+    ResultIterator iter_execute(const std::string& sql, const std::vector<Value>& params);
+
+    // Run the same statement once per parameter row, preparing it only once. The batch is atomic: on failure
+    // none of its rows are applied, whether or not a transaction is open.
+    void execute_many(const std::string& sql, const std::vector<std::vector<Value>>& params_list);
+
+    // Opt-in cache of read-only query results keyed by SQL text and parameters (off by default).
+    // Any write, schema or connection statement (ATTACH, DETACH, PRAGMA, ...) through this Database clears it;
+    // writes by other connections and non-deterministic functions such as random() are not detected.
+    void enable_query_cache(bool enabled = true);
+    bool query_cache_enabled() const;
+
     int64_t last_insert_rowid() const;
     int changes() const;
 
@@ -74,7 +125,6 @@ private:
     std::vector<std::string> get_vector_tables(const std::string& collection) const;
     std::vector<std::string> get_set_tables(const std::string& collection) const;
     std::vector<std::string> get_time_series_tables(const std::string& collection) const;
-    std::vector<std::string> get_table_columns(const std::string& table) const;
 
     // Foreign key introspection
     struct ForeignKeyInfo {
@@ -90,12 +140,13 @@ private:
     void insert_time_series(const std::string& collection, int64_t element_id,
                             const std::map<std::string, TimeSeries>& time_series);
 
-    // Relation resolution
-    Value resolve_relation(const std::string& table, const std::string& column, const Value& value);
+    // Relation resolution (fks is the table's get_foreign_keys(), fetched once by the caller)
+    Value resolve_relation(const std::vector<ForeignKeyInfo>& fks, const std::string& column, const Value& value);
 
-    // Type validation
-    std::string get_column_type(const std::string& table, const std::string& column) const;
-    void validate_value_type(const std::string& table, const std::string& column, const Value& value);
+    // Type validation (column types and foreign keys are fetched once per table by the caller)
+    std::map<std::string, std::string> get_column_types(const std::string& table) const;
+    void validate_value_type(const std::map<std::string, std::string>& column_types,
+                             const std::vector<ForeignKeyInfo>& fks, const std::string& column, const Value& value);
 };
 
 }  // namespace psr
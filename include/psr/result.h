@@ -8,6 +8,7 @@
 #include <memory>
 #include <optional>
 #include <string>
+#include <string_view>
 #include <variant>
 #include <vector>
 
@@ -35,6 +36,8 @@ public:
     std::optional<int64_t> get_int(size_t index) const;
     std::optional<double> get_double(size_t index) const;
     std::optional<std::string> get_string(size_t index) const;
+    // Non-owning view into the row's text; valid while the Row (and its Result) is alive
+    std::optional<std::string_view> get_string_view(size_t index) const;
     std::optional<std::vector<uint8_t>> get_blob(size_t index) const;
     bool is_null(size_t index) const;
 
@@ -46,6 +49,9 @@ class PSR_API Result {
 public:
     Result() = default;
     Result(std::vector<std::string> columns, std::vector<Row> rows);
+    // Shares one column-name list between every Result produced by the same statement
+    Result(std::shared_ptr<const std::vector<std::string>> columns, std::vector<Row> rows,
+           int64_t last_insert_rowid = 0, int64_t changes = 0);
 
     bool empty() const;
     size_t row_count() const;
@@ -54,13 +60,22 @@ public:
     const std::vector<std::string>& columns() const;
     const Row& operator[](size_t index) const;
 
+    // Rowid of the last row inserted by the statement; 0 when it inserted no rows
+    int64_t last_insert_rowid() const;
+    int64_t changes() const;
+
     // Iterator support
-    auto begin() const { return rows_.begin(); }
-    auto end() const { return rows_.end(); }
+    auto begin() const { return rows().begin(); }
+    auto end() const { return rows().end(); }
 
 private:
-    std::vector<std::string> columns_;
-    std::vector<Row> rows_;
+    const std::vector<Row>& rows() const;
+
+    // Both are shared by copies, so copying a Result (e.g. out of the query cache) does not copy its rows
+    std::shared_ptr<const std::vector<std::string>> columns_;
+    std::shared_ptr<const std::vector<Row>> rows_;  // nullptr when there are no rows
+    int64_t last_insert_rowid_ = 0;
+    int64_t changes_ = 0;
 };
 
 }  // namespace psr
@@ -34,7 +34,8 @@ psr::LogLevel to_cpp_log_level(psr_log_level_t level) {
 struct psr_database {
     psr::Database db;
     std::string last_error;
-    psr_database(const std::string& path, psr::LogLevel level) : db(path, level) {}
+    psr_database(const std::string& path, psr::LogLevel level, bool performance_pragmas)
+        : db(path, level, performance_pragmas) {}
     psr_database(psr::Database&& database) : db(std::move(database)) {}
 };
 
@@ -57,6 +58,11 @@ extern "C" {
 // Database functions
 
 PSR_C_API psr_database_t* psr_database_open(const char* path, psr_log_level_t console_level, psr_error_t* error) {
+    return psr_database_open_ex(path, console_level, 1, error);
+}
+
+PSR_C_API psr_database_t* psr_database_open_ex(const char* path, psr_log_level_t console_level, int performance_pragmas,
+                                               psr_error_t* error) {
     if (!path) {
         if (error)
             *error = PSR_ERROR_INVALID_ARGUMENT;
@@ -64,7 +70,7 @@ PSR_C_API psr_database_t* psr_database_open(const char* path, psr_log_level_t co
     }
 
     try {
-        auto* db = new psr_database(path, to_cpp_log_level(console_level));
+        auto* db = new psr_database(path, to_cpp_log_level(console_level), performance_pragmas != 0);
         if (error)
             *error = PSR_OK;
         return db;
@@ -81,6 +87,12 @@ PSR_C_API psr_database_t* psr_database_open(const char* path, psr_log_level_t co
 
 PSR_C_API psr_database_t* psr_database_from_schema(const char* db_path, const char* schema_path,
                                                    psr_log_level_t console_level, psr_error_t* error) {
+    return psr_database_from_schema_ex(db_path, schema_path, console_level, 1, error);
+}
+
+PSR_C_API psr_database_t* psr_database_from_schema_ex(const char* db_path, const char* schema_path,
+                                                      psr_log_level_t console_level, int performance_pragmas,
+                                                      psr_error_t* error) {
     if (!db_path || !schema_path) {
         if (error)
             *error = PSR_ERROR_INVALID_ARGUMENT;
@@ -88,7 +100,8 @@ PSR_C_API psr_database_t* psr_database_from_schema(const char* db_path, const ch
     }
 
     try {
-        auto database = psr::Database::from_schema(db_path, schema_path, to_cpp_log_level(console_level));
+        auto database =
+            psr::Database::from_schema(db_path, schema_path, to_cpp_log_level(console_level), performance_pragmas != 0);
         auto* db = new psr_database(std::move(database));
         if (error)
             *error = PSR_OK;
@@ -145,6 +158,39 @@ PSR_C_API psr_result_t* psr_database_execute(psr_database_t* db, const char* sql
     }
 }
 
+PSR_C_API psr_result_t* psr_database_execute_uncached(psr_database_t* db, const char* sql, psr_error_t* error) {
+    if (!db || !sql) {
+        if (error)
+            *error = PSR_ERROR_INVALID_ARGUMENT;
+        return nullptr;
+    }
+
+    try {
+        auto result = db->db.execute_uncached(sql);
+        auto* res = new psr_result(std::move(result));
+        if (error)
+            *error = PSR_OK;
+        return res;
+    } catch (const std::bad_alloc&) {
+        if (error)
+            *error = PSR_ERROR_NO_MEMORY;
+        db->last_error = "Out of memory";
+        return nullptr;
+    } catch (const std::exception& e) {
+        if (error)
+            *error = PSR_ERROR_QUERY;
+        db->last_error = e.what();
+        return nullptr;
+    }
+}
+
+PSR_C_API psr_error_t psr_database_enable_query_cache(psr_database_t* db, int enabled) {
+    if (!db)
+        return PSR_ERROR_INVALID_ARGUMENT;
+    db->db.enable_query_cache(enabled != 0);
+    return PSR_OK;
+}
+
 PSR_C_API int64_t psr_database_last_insert_rowid(psr_database_t* db) {
     if (!db)
         return 0;
@@ -495,6 +541,18 @@ PSR_C_API size_t psr_result_column_count(psr_result_t* result) {
     return result->result.column_count();
 }
 
+PSR_C_API int64_t psr_result_last_insert_rowid(psr_result_t* result) {
+    if (!result)
+        return 0;
+    return result->result.last_insert_rowid();
+}
+
+PSR_C_API int64_t psr_result_changes(psr_result_t* result) {
+    if (!result)
+        return 0;
+    return result->result.changes();
+}
+
 PSR_C_API const char* psr_result_column_name(psr_result_t* result, size_t col) {
     if (!result || col >= result->result.column_count())
         return nullptr;
@@ -586,4 +644,96 @@ PSR_C_API const uint8_t* psr_result_get_blob(psr_result_t* result, size_t row, s
     return nullptr;
 }
 
+PSR_C_API psr_error_t psr_result_fetch_all(psr_result_t* result, psr_value_t* values, size_t count) {
+    if (!result || (!values && count > 0))
+        return PSR_ERROR_INVALID_ARGUMENT;
+
+    size_t column_count = result->result.column_count();
+    if (count < result->result.row_count() * column_count) {
+        return PSR_ERROR_INDEX_OUT_OF_RANGE;
+    }
+
+    psr_value_t* out = values;
+    for (const auto& row : result->result) {
+        for (size_t col = 0; col < column_count; ++col, ++out) {
+            *out = psr_value_t{PSR_TYPE_NULL, 0, 0.0, nullptr, nullptr, 0};
+            const auto& value = row[col];
+            if (const auto* i = std::get_if<int64_t>(&value)) {
+                out->type = PSR_TYPE_INTEGER;
+                out->int_value = *i;
+            } else if (const auto* d = std::get_if<double>(&value)) {
+                out->type = PSR_TYPE_FLOAT;
+                out->double_value = *d;
+            } else if (const auto* str = std::get_if<std::string>(&value)) {
+                out->type = PSR_TYPE_TEXT;
+                out->string_value = str->c_str();
+            } else if (const auto* blob = std::get_if<std::vector<uint8_t>>(&value)) {
+                out->type = PSR_TYPE_BLOB;
+                out->blob_value = blob->data();
+                out->blob_size = blob->size();
+            }
+        }
+    }
+    return PSR_OK;
+}
+
+PSR_C_API psr_error_t psr_result_get_int_column(psr_result_t* result, size_t col, int64_t* values, uint8_t* nulls,
+                                                size_t count) {
+    if (!result || (!values && count > 0))
+        return PSR_ERROR_INVALID_ARGUMENT;
+    if (col >= result->result.column_count() || count < result->result.row_count()) {
+        return PSR_ERROR_INDEX_OUT_OF_RANGE;
+    }
+
+    size_t row = 0;
+    for (const auto& r : result->result) {
+        const auto& value = r[col];
+        if (const auto* i = std::get_if<int64_t>(&value)) {
+            values[row] = *i;
+            if (nulls)
+                nulls[row] = 0;
+        } else if (std::holds_alternative<std::nullptr_t>(value)) {
+            values[row] = 0;
+            if (nulls)
+                nulls[row] = 1;
+        } else {
+            return PSR_ERROR_INVALID_ARGUMENT;
+        }
+        ++row;
+    }
+    return PSR_OK;
+}
+
+PSR_C_API psr_error_t psr_result_get_double_column(psr_result_t* result, size_t col, double* values, uint8_t* nulls,
+                                                   size_t count) {
+    if (!result || (!values && count > 0))
+        return PSR_ERROR_INVALID_ARGUMENT;
+    if (col >= result->result.column_count() || count < result->result.row_count()) {
+        return PSR_ERROR_INDEX_OUT_OF_RANGE;
+    }
+
+    size_t row = 0;
+    for (const auto& r : result->result) {
+        const auto& value = r[col];
+        if (const auto* d = std::get_if<double>(&value)) {
+            values[row] = *d;
+            if (nulls)
+                nulls[row] = 0;
+        } else if (const auto* i = std::get_if<int64_t>(&value)) {
+            // SQLite may hand back integral values from REAL columns
+            values[row] = static_cast<double>(*i);
+            if (nulls)
+                nulls[row] = 0;
+        } else if (std::holds_alternative<std::nullptr_t>(value)) {
+            values[row] = 0.0;
+            if (nulls)
+                nulls[row] = 1;
+        } else {
+            return PSR_ERROR_INVALID_ARGUMENT;
+        }
+        ++row;
+    }
+    return PSR_OK;
+}
+
 }  // extern "C"
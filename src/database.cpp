@@ -2,9 +2,12 @@
 
 #include <algorithm>
 #include <atomic>
+#include <cctype>
+#include <chrono>
 #include <filesystem>
 #include <fstream>
 #include <limits>
+#include <list>
 #include <set>
 #include <spdlog/sinks/basic_file_sink.h>
 #include <spdlog/sinks/stdout_color_sinks.h>
@@ -12,6 +15,9 @@
 #include <sqlite3.h>
 #include <sstream>
 #include <stdexcept>
+#include <string_view>
+#include <thread>
+#include <unordered_map>
 
 namespace {
 
@@ -82,6 +88,341 @@ std::shared_ptr<spdlog::logger> create_database_logger(const std::string& db_pat
     return logger;
 }
 
+constexpr size_t statement_cache_capacity = 64;
+constexpr size_t query_cache_capacity = 256;
+constexpr size_t max_row_count_hint = 1024;  // bounds unused reservation to ~24 KiB when a result shrinks
+constexpr int busy_max_retries = 100;
+
+// Waits for a lock held by another connection with exponential backoff (1 us doubling up to 50 ms per try),
+// giving up after busy_max_retries tries (a little over 4 seconds in total)
+int busy_handler(void*, int count) {
+    if (count >= busy_max_retries) {
+        return 0;
+    }
+    auto delay = std::min<int64_t>(int64_t{1} << std::min(count, 16), 50000);
+    std::this_thread::sleep_for(std::chrono::microseconds(delay));
+    return 1;
+}
+
+// Returns the first SQL keyword (uppercased), skipping leading whitespace and comments
+std::string leading_keyword(const std::string& sql) {
+    size_t i = 0;
+    while (i < sql.size()) {
+        if (std::isspace(static_cast<unsigned char>(sql[i]))) {
+            ++i;
+        } else if (sql.compare(i, 2, "--") == 0) {
+            i = sql.find('\n', i);
+            if (i == std::string::npos) {
+                return "";
+            }
+        } else if (sql.compare(i, 2, "/*") == 0) {
+            i = sql.find("*/", i + 2);
+            if (i == std::string::npos) {
+                return "";
+            }
+            i += 2;
+        } else {
+            break;
+        }
+    }
+
+    std::string keyword;
+    while (i < sql.size() && std::isalpha(static_cast<unsigned char>(sql[i]))) {
+        keyword += static_cast<char>(std::toupper(static_cast<unsigned char>(sql[i])));
+        ++i;
+    }
+    return keyword;
+}
+
+// Schema and connection statements, which run once through the uncached path. They also clear the query cache:
+// ATTACH, DETACH and most PRAGMAs count as read-only yet can change what a cached query returns.
+bool is_schema_statement(const std::string& sql) {
+    static const std::set<std::string> keywords = {"ALTER", "ANALYZE", "ATTACH",  "CREATE", "DETACH",
+                                                   "DROP",  "PRAGMA",  "REINDEX", "VACUUM"};
+    return keywords.count(leading_keyword(sql)) > 0;
+}
+
+// DDL and ATTACH/DETACH finalize every cached statement, releasing statements compiled against objects that
+// may no longer exist. Other statements leave the cache alone: SQLite re-prepares stale statements itself.
+bool is_ddl_statement(const std::string& sql) {
+    static const std::set<std::string> keywords = {"ALTER", "ATTACH", "CREATE", "DETACH", "DROP"};
+    return keywords.count(leading_keyword(sql)) > 0;
+}
+
+// A prepared statement together with the column names of its result set, which are read from SQLite
+// only once and shared by every Result it produces
+struct PreparedStatement {
+    sqlite3_stmt* stmt = nullptr;
+    std::shared_ptr<const std::vector<std::string>> columns;
+    int reprepare_count = -1;   // SQLITE_STMTSTATUS_REPREPARE value when columns was filled
+    size_t row_count_hint = 0;  // rows returned by the previous run (capped), used to pre-size the next one
+    bool query = false;         // is_query_statement, classified once when the statement is prepared
+};
+
+// Statements whose results may be served from the query cache (still subject to sqlite3_stmt_readonly)
+bool is_query_statement(const std::string& sql) {
+    auto keyword = leading_keyword(sql);
+    return keyword == "SELECT" || keyword == "WITH" || keyword == "VALUES";
+}
+
+// Query cache key: the SQL text followed by each parameter's type index and raw bytes
+std::string query_cache_key(const std::string& sql, const std::vector<psr::Value>& params) {
+    std::string key = sql;
+    for (const auto& param : params) {
+        key += '\0';
+        key += static_cast<char>(param.index());
+        std::visit(
+            [&](auto&& arg) {
+                using T = std::decay_t<decltype(arg)>;
+                if constexpr (std::is_same_v<T, int64_t> || std::is_same_v<T, double>) {
+                    key.append(reinterpret_cast<const char*>(&arg), sizeof(arg));
+                } else if constexpr (std::is_same_v<T, std::string> || std::is_same_v<T, std::vector<uint8_t>>) {
+                    size_t size = arg.size();
+                    key.append(reinterpret_cast<const char*>(&size), sizeof(size));
+                    key.append(reinterpret_cast<const char*>(arg.data()), size);
+                }
+            },
+            param);
+    }
+    return key;
+}
+
+// LRU cache of prepared statements keyed by SQL text.
+// Statements are removed from the cache while in use, so nested executions never share a sqlite3_stmt.
+class StatementCache {
+public:
+    explicit StatementCache(size_t capacity) : capacity_(capacity) {}
+    ~StatementCache() { clear(); }
+
+    StatementCache(const StatementCache&) = delete;
+    StatementCache& operator=(const StatementCache&) = delete;
+
+    // Takes the cached statement for sql out of the cache, or returns an empty one (stmt == nullptr) on a miss
+    PreparedStatement acquire(const std::string& sql) {
+        auto it = index_.find(sql);
+        if (it == index_.end()) {
+            return {};
+        }
+        PreparedStatement prepared = std::move(it->second->second);
+        entries_.erase(it->second);
+        index_.erase(it);
+        return prepared;
+    }
+
+    // Resets a statement and stores it as most recently used, finalizing the LRU entry when full
+    void release(const std::string& sql, PreparedStatement prepared) {
+        if (!prepared.stmt) {
+            return;
+        }
+        sqlite3_reset(prepared.stmt);
+        sqlite3_clear_bindings(prepared.stmt);
+
+        if (index_.count(sql) > 0 || capacity_ == 0) {
+            sqlite3_finalize(prepared.stmt);
+            return;
+        }
+        if (entries_.size() >= capacity_) {
+            auto& lru = entries_.back();
+            index_.erase(lru.first);
+            sqlite3_finalize(lru.second.stmt);
+            entries_.pop_back();
+        }
+        entries_.emplace_front(sql, std::move(prepared));
+        index_[entries_.front().first] = entries_.begin();
+    }
+
+    // Finalizes every cached statement (must run before sqlite3_close)
+    void clear() {
+        for (auto& [sql, prepared] : entries_) {
+            sqlite3_finalize(prepared.stmt);
+        }
+        entries_.clear();
+        index_.clear();
+    }
+
+    // Finalizes every cached statement and stops caching, so statements still checked out (by a live
+    // ResultIterator) are finalized as soon as they are released
+    void close() {
+        capacity_ = 0;
+        clear();
+    }
+
+private:
+    using Entry = std::pair<std::string, PreparedStatement>;
+
+    size_t capacity_;
+    std::list<Entry> entries_;  // most recently used first
+    std::unordered_map<std::string_view, std::list<Entry>::iterator> index_;
+};
+
+// Runs the guard's lifetime inside a savepoint, which starts a transaction when none is open and nests inside
+// the caller's otherwise, so the guarded work is applied atomically either way.
+// Rolls back to the savepoint on destruction if release() was not reached.
+class BatchSavepoint {
+public:
+    explicit BatchSavepoint(sqlite3* db) : db_(db) {
+        if (sqlite3_exec(db_, "SAVEPOINT psr_batch", nullptr, nullptr, nullptr) != SQLITE_OK) {
+            throw std::runtime_error("Failed to begin transaction: " + std::string(sqlite3_errmsg(db_)));
+        }
+        active_ = true;
+    }
+
+    ~BatchSavepoint() {
+        if (active_) {
+            // Fails harmlessly if SQLite already rolled back the whole transaction
+            sqlite3_exec(db_, "ROLLBACK TO psr_batch; RELEASE psr_batch", nullptr, nullptr, nullptr);
+        }
+    }
+
+    BatchSavepoint(const BatchSavepoint&) = delete;
+    BatchSavepoint& operator=(const BatchSavepoint&) = delete;
+
+    void release() {
+        if (sqlite3_exec(db_, "RELEASE psr_batch", nullptr, nullptr, nullptr) != SQLITE_OK) {
+            throw std::runtime_error("Failed to commit transaction: " + std::string(sqlite3_errmsg(db_)));
+        }
+        active_ = false;
+    }
+
+private:
+    sqlite3* db_;
+    bool active_ = false;
+};
+
+// Binds params to the statement's positional parameters (1-indexed).
+// Text and blobs are bound without copying (SQLITE_STATIC), so params must outlive every sqlite3_step
+// on the statement until its bindings are cleared.
+void bind_params(sqlite3_stmt* stmt, const std::vector<psr::Value>& params) {
+    for (size_t i = 0; i < params.size(); ++i) {
+        int idx = static_cast<int>(i + 1);
+        const auto& param = params[i];
+
+        std::visit(
+            [&](auto&& arg) {
+                using T = std::decay_t<decltype(arg)>;
+                if constexpr (std::is_same_v<T, std::nullptr_t>) {
+                    sqlite3_bind_null(stmt, idx);
+                } else if constexpr (std::is_same_v<T, int64_t>) {
+                    sqlite3_bind_int64(stmt, idx, arg);
+                } else if constexpr (std::is_same_v<T, double>) {
+                    sqlite3_bind_double(stmt, idx, arg);
+                } else if constexpr (std::is_same_v<T, std::string>) {
+                    sqlite3_bind_text64(stmt, idx, arg.data(), arg.size(), SQLITE_STATIC, SQLITE_UTF8);
+                } else if constexpr (std::is_same_v<T, std::vector<uint8_t>>) {
+                    sqlite3_bind_blob64(stmt, idx, arg.data(), arg.size(), SQLITE_STATIC);
+                }
+            },
+            param);
+    }
+}
+
+// Copies the current row of a statement that just returned SQLITE_ROW
+psr::Row read_row(sqlite3_stmt* stmt, int col_count) {
+    std::vector<psr::Value> values;
+    values.reserve(col_count);
+
+    for (int i = 0; i < col_count; ++i) {
+        int type = sqlite3_column_type(stmt, i);
+        switch (type) {
+        case SQLITE_INTEGER:
+            values.emplace_back(sqlite3_column_int64(stmt, i));
+            break;
+        case SQLITE_FLOAT:
+            values.emplace_back(sqlite3_column_double(stmt, i));
+            break;
+        case SQLITE_TEXT: {
+            // Length comes from SQLite (call order per sqlite3_column_bytes docs), so no strlen scan
+            const char* text = reinterpret_cast<const char*>(sqlite3_column_text(stmt, i));
+            int size = sqlite3_column_bytes(stmt, i);
+            values.emplace_back(text ? std::string(text, size) : std::string());
+            break;
+        }
+        case SQLITE_BLOB: {
+            const uint8_t* data = reinterpret_cast<const uint8_t*>(sqlite3_column_blob(stmt, i));
+            int size = sqlite3_column_bytes(stmt, i);
+            values.emplace_back(std::vector<uint8_t>(data, data + size));
+            break;
+        }
+        case SQLITE_NULL:
+        default:
+            values.emplace_back(nullptr);
+            break;
+        }
+    }
+    return psr::Row(std::move(values));
+}
+
+// Column names only change when SQLite re-prepares the statement after a schema change.
+// Must run after the first sqlite3_step, which may re-prepare it.
+void refresh_columns(PreparedStatement& prepared) {
+    sqlite3_stmt* stmt = prepared.stmt;
+    int reprepare_count = sqlite3_stmt_status(stmt, SQLITE_STMTSTATUS_REPREPARE, 0);
+    if (prepared.columns && prepared.reprepare_count == reprepare_count) {
+        return;
+    }
+
+    int col_count = sqlite3_column_count(stmt);
+    std::vector<std::string> columns;
+    columns.reserve(col_count);
+    for (int i = 0; i < col_count; ++i) {
+        const char* name = sqlite3_column_name(stmt, i);
+        columns.emplace_back(name ? name : "");
+    }
+    prepared.columns = std::make_shared<const std::vector<std::string>>(std::move(columns));
+    prepared.reprepare_count = reprepare_count;
+}
+
+// Binds params, steps the statement to completion and collects its rows into result.
+// Returns the last sqlite3_step code (SQLITE_DONE on success).
+int run_statement(PreparedStatement& prepared, const std::vector<psr::Value>& params, psr::Result& result) {
+    sqlite3_stmt* stmt = prepared.stmt;
+    sqlite3* db = sqlite3_db_handle(stmt);
+    bool writes = !sqlite3_stmt_readonly(stmt);
+    int64_t total_changes = writes ? sqlite3_total_changes64(db) : 0;
+
+    // sqlite3_last_insert_rowid keeps the rowid of the connection's previous INSERT after an UPDATE, DELETE or
+    // upsert that only updated, so it is zeroed for the run and restored if the statement inserted nothing
+    int64_t previous_rowid = 0;
+    if (writes) {
+        previous_rowid = sqlite3_last_insert_rowid(db);
+        sqlite3_set_last_insert_rowid(db, 0);
+    }
+
+    bind_params(stmt, params);
+
+    // The first step may transparently re-prepare the statement, so the column count is read after it
+    int rc = sqlite3_step(stmt);
+    int col_count = sqlite3_column_count(stmt);
+
+    std::vector<psr::Row> rows;
+    rows.reserve(prepared.row_count_hint);
+    for (; rc == SQLITE_ROW; rc = sqlite3_step(stmt)) {
+        rows.push_back(read_row(stmt, col_count));
+    }
+
+    prepared.row_count_hint = std::min(rows.size(), max_row_count_hint);
+    refresh_columns(prepared);
+
+    int64_t last_insert_rowid = 0;
+    if (writes) {
+        last_insert_rowid = sqlite3_last_insert_rowid(db);
+        if (last_insert_rowid == 0 || rc != SQLITE_DONE) {
+            sqlite3_set_last_insert_rowid(db, previous_rowid);
+            last_insert_rowid = 0;
+        }
+    }
+
+    // sqlite3_changes64 keeps the count of the previous INSERT/UPDATE/DELETE after statements such as
+    // CREATE TABLE, so it is only read when the total change counter moved
+    int64_t changes = 0;
+    if (writes && rc == SQLITE_DONE && sqlite3_total_changes64(db) != total_changes) {
+        changes = sqlite3_changes64(db);
+    }
+
+    result = psr::Result(prepared.columns, std::move(rows), last_insert_rowid, changes);
+    return rc;
+}
+
 }  // anonymous namespace
 
 namespace psr {
@@ -92,15 +433,111 @@ struct Database::Impl {
     std::string schema_path;
     std::string last_error;
     std::shared_ptr<spdlog::logger> logger;
+    StatementCache statements{statement_cache_capacity};
+    bool query_cache_enabled = false;
+    std::unordered_map<std::string, Result> query_cache;
+
+    // Insert plan per table: column types and foreign keys, introspected once and reused by create_element
+    // until the schema cookie changes (on this or any other connection)
+    struct TableInfo {
+        std::map<std::string, std::string> column_types;
+        std::vector<ForeignKeyInfo> foreign_keys;
+    };
+    std::unordered_map<std::string, TableInfo> tables;
+    int64_t tables_schema_version = -1;
+    sqlite3_stmt* schema_version_stmt = nullptr;
+
+    // Transaction control statements, prepared once at open
+    sqlite3_stmt* begin_stmt = nullptr;
+    sqlite3_stmt* commit_stmt = nullptr;
+    sqlite3_stmt* rollback_stmt = nullptr;
+
+    void prepare_transaction_statements() {
+        for (auto [sql, stmt] : {std::pair{"BEGIN TRANSACTION", &begin_stmt}, std::pair{"COMMIT", &commit_stmt},
+                                 std::pair{"ROLLBACK", &rollback_stmt}}) {
+            if (sqlite3_prepare_v3(db, sql, -1, SQLITE_PREPARE_PERSISTENT, stmt, nullptr) != SQLITE_OK) {
+                throw std::runtime_error("Failed to prepare statement: " + std::string(sqlite3_errmsg(db)));
+            }
+        }
+    }
+
+    // Steps a transaction control statement without building a Result
+    void run_transaction_statement(sqlite3_stmt* stmt, const char* action) {
+        if (sqlite3_step(stmt) != SQLITE_DONE) {
+            std::string error = sqlite3_errmsg(db);
+            sqlite3_reset(stmt);
+            throw std::runtime_error(std::string("Failed to ") + action + " transaction: " + error);
+        }
+        sqlite3_reset(stmt);
+    }
+
+    int64_t schema_version() {
+        if (!schema_version_stmt && sqlite3_prepare_v3(db, "PRAGMA schema_version", -1, SQLITE_PREPARE_PERSISTENT,
+                                                       &schema_version_stmt, nullptr) != SQLITE_OK) {
+            throw std::runtime_error("Failed to prepare statement: " + std::string(sqlite3_errmsg(db)));
+        }
+        int64_t version = -1;
+        if (sqlite3_step(schema_version_stmt) == SQLITE_ROW) {
+            version = sqlite3_column_int64(schema_version_stmt, 0);
+        }
+        sqlite3_reset(schema_version_stmt);
+        return version;
+    }
+
+    const TableInfo& table_info(const Database& database, const std::string& table) {
+        int64_t version = schema_version();
+        if (version != tables_schema_version) {
+            tables.clear();
+            tables_schema_version = version;
+        }
+
+        auto it = tables.find(table);
+        if (it == tables.end()) {
+            TableInfo info{database.get_column_types(table), database.get_foreign_keys(table)};
+            it = tables.emplace(table, std::move(info)).first;
+        }
+        return it->second;
+    }
+
+    // Must run before sqlite3_close_v2
+    void finalize_statements() {
+        statements.close();
+        for (sqlite3_stmt** stmt : {&schema_version_stmt, &begin_stmt, &commit_stmt, &rollback_stmt}) {
+            sqlite3_finalize(*stmt);
+            *stmt = nullptr;
+        }
+        tables.clear();
+        tables_schema_version = -1;
+    }
+
+    // Any statement that may write drops every cached result
+    void invalidate_query_cache(sqlite3_stmt* stmt) {
+        if (!query_cache.empty() && !sqlite3_stmt_readonly(stmt)) {
+            query_cache.clear();
+        }
+    }
+
+    // Results read inside a transaction are not cached, since a rollback could leave them stale
+    void store_query_result(std::string key, const Result& result) {
+        if (sqlite3_get_autocommit(db) == 0) {
+            return;
+        }
+        if (query_cache.size() >= query_cache_capacity) {
+            query_cache.clear();
+        }
+        query_cache.emplace(std::move(key), result);
+    }
 
     ~Impl() {
+        finalize_statements();
         if (db) {
-            sqlite3_close(db);
+            sqlite3_close_v2(db);
         }
     }
 };
 
-Database::Database(const std::string& path, LogLevel console_level) : impl_(std::make_unique<Impl>()) {
+Database::Database(const std::string& path, LogLevel console_level, bool performance_pragmas)
+    : impl_(std::make_unique<Impl>()) {
     impl_->path = path;
     impl_->logger = create_database_logger(path, console_level);
 
@@ -115,9 +552,51 @@ Database::Database(const std::string& path, LogLevel console_level) : impl_(std:
         throw std::runtime_error("Failed to open database: " + error);
     }
 
+    // Retry inside SQLite instead of failing with SQLITE_BUSY while another connection holds the lock
+    sqlite3_busy_handler(impl_->db, busy_handler, nullptr);
+
     // Enable foreign keys
     sqlite3_exec(impl_->db, "PRAGMA foreign_keys = ON;", nullptr, nullptr, nullptr);
     impl_->logger->debug("Database opened successfully, foreign keys enabled");
+
+    if (performance_pragmas) {
+        bool in_memory = path == ":memory:" || path.empty();
+
+        // journal_mode reports the mode in effect rather than failing when WAL is unavailable (read-only media,
+        // a VFS without shared memory), and synchronous = NORMAL is only safe on power loss under WAL
+        std::string journal_mode;
+        if (!in_memory) {
+            sqlite3_exec(
+                impl_->db, "PRAGMA journal_mode = WAL",
+                [](void* out, int, char** values, char**) {
+                    if (values[0]) {
+                        *static_cast<std::string*>(out) = values[0];
+                    }
+                    return 0;
+                },
+                &journal_mode, nullptr);
+            if (journal_mode != "wal") {
+                impl_->logger->warn("WAL journal mode unavailable (journal_mode = {}), keeping synchronous = FULL",
+                                    journal_mode.empty() ? "unknown" : journal_mode);
+            }
+        }
+
+        std::string pragmas = in_memory ? "" : "PRAGMA mmap_size = 268435456; ";
+        if (journal_mode == "wal") {
+            pragmas += "PRAGMA synchronous = NORMAL; ";
+        }
+        pragmas += "PRAGMA temp_store = MEMORY; PRAGMA cache_size = -65536;";
+
+        char* error = nullptr;
+        if (sqlite3_exec(impl_->db, pragmas.c_str(), nullptr, nullptr, &error) != SQLITE_OK) {
+            impl_->logger->warn("Failed to apply performance pragmas: {}", error ? error : "unknown error");
+        } else {
+            impl_->logger->debug("Performance pragmas applied");
+        }
+        sqlite3_free(error);
+    }
+
+    impl_->prepare_transaction_statements();
 }
 
 Database::~Database() = default;
@@ -132,7 +611,10 @@ bool Database::is_open() const {
 
 void Database::close() {
     if (impl_ && impl_->db) {
-        sqlite3_close(impl_->db);
+        impl_->finalize_statements();
+        impl_->query_cache.clear();
+        // A statement still held by a ResultIterator keeps the connection open until the iterator releases it
+        sqlite3_close_v2(impl_->db);
         impl_->db = nullptr;
     }
 }
@@ -146,86 +628,275 @@ Result Database::execute(const std::string& sql, const std::vector<Value>& param
         throw std::runtime_error("Database is not open");
     }
 
-    sqlite3_stmt* stmt = nullptr;
-    int rc = sqlite3_prepare_v2(impl_->db, sql.c_str(), -1, &stmt, nullptr);
+    // Reuse a cached statement (already reset with cleared bindings) or prepare a new long-lived one.
+    // Schema statements are never cached, so the SQL text is only classified on a miss.
+    PreparedStatement prepared = impl_->statements.acquire(sql);
+    if (!prepared.stmt) {
+        // One-shot schema statements skip the cache so their short-lived allocations can use lookaside memory
+        if (is_schema_statement(sql)) {
+            return execute_uncached(sql, params);
+        }
+        int rc = sqlite3_prepare_v3(impl_->db, sql.c_str(), -1, SQLITE_PREPARE_PERSISTENT, &prepared.stmt, nullptr);
+        if (rc != SQLITE_OK) {
+            throw std::runtime_error("Failed to prepare statement: " + std::string(sqlite3_errmsg(impl_->db)));
+        }
+        prepared.query = is_query_statement(sql);
+    }
+
+    std::string cache_key;
+    if (impl_->query_cache_enabled && prepared.query) {
+        cache_key = query_cache_key(sql, params);
+        auto it = impl_->query_cache.find(cache_key);
+        if (it != impl_->query_cache.end()) {
+            impl_->statements.release(sql, std::move(prepared));
+            return it->second;
+        }
+    }
+    impl_->invalidate_query_cache(prepared.stmt);
+
+    Result result;
+    int rc = run_statement(prepared, params, result);
+    if (rc != SQLITE_DONE) {
+        std::string error = sqlite3_errmsg(impl_->db);
+        sqlite3_finalize(prepared.stmt);
+        throw std::runtime_error("Failed to execute statement: " + error);
+    }
+
+    if (!cache_key.empty() && sqlite3_stmt_readonly(prepared.stmt)) {
+        impl_->store_query_result(std::move(cache_key), result);
+    }
+
+    impl_->statements.release(sql, std::move(prepared));
+    return result;
+}
+
+Result Database::execute_uncached(const std::string& sql) {
+    return execute_uncached(sql, {});
+}
+
+Result Database::execute_uncached(const std::string& sql, const std::vector<Value>& params) {
+    if (!is_open()) {
+        throw std::runtime_error("Database is not open");
+    }
+
+    if (is_ddl_statement(sql)) {
+        impl_->statements.clear();
+    }
+    if (is_schema_statement(sql)) {
+        impl_->query_cache.clear();
+    }
+
+    PreparedStatement prepared;
+    int rc = sqlite3_prepare_v2(impl_->db, sql.c_str(), -1, &prepared.stmt, nullptr);
     if (rc != SQLITE_OK) {
         throw std::runtime_error("Failed to prepare statement: " + std::string(sqlite3_errmsg(impl_->db)));
     }
+    impl_->invalidate_query_cache(prepared.stmt);
 
-    // Bind parameters
-    for (size_t i = 0; i < params.size(); ++i) {
-        int idx = static_cast<int>(i + 1);
-        const auto& param = params[i];
+    Result result;
+    rc = run_statement(prepared, params, result);
+    if (rc != SQLITE_DONE) {
+        std::string error = sqlite3_errmsg(impl_->db);
+        sqlite3_finalize(prepared.stmt);
+        throw std::runtime_error("Failed to execute statement: " + error);
+    }
 
-        std::visit(
-            [&](auto&& arg) {
-                using T = std::decay_t<decltype(arg)>;
-                if constexpr (std::is_same_v<T, std::nullptr_t>) {
-                    sqlite3_bind_null(stmt, idx);
-                } else if constexpr (std::is_same_v<T, int64_t>) {
-                    sqlite3_bind_int64(stmt, idx, arg);
-                } else if constexpr (std::is_same_v<T, double>) {
-                    sqlite3_bind_double(stmt, idx, arg);
-                } else if constexpr (std::is_same_v<T, std::string>) {
-                    sqlite3_bind_text(stmt, idx, arg.c_str(), static_cast<int>(arg.size()), SQLITE_TRANSIENT);
-                } else if constexpr (std::is_same_v<T, std::vector<uint8_t>>) {
-                    sqlite3_bind_blob(stmt, idx, arg.data(), static_cast<int>(arg.size()), SQLITE_TRANSIENT);
-                }
-            },
-            param);
+    sqlite3_finalize(prepared.stmt);
+    return result;
+}
+
+void Database::execute_many(const std::string& sql, const std::vector<std::vector<Value>>& params_list) {
+    if (!is_open()) {
+        throw std::runtime_error("Database is not open");
     }
 
-    // Get column info
-    std::vector<std::string> columns;
-    int col_count = sqlite3_column_count(stmt);
-    columns.reserve(col_count);
-    for (int i = 0; i < col_count; ++i) {
-        const char* name = sqlite3_column_name(stmt, i);
-        columns.emplace_back(name ? name : "");
+    if (params_list.empty()) {
+        return;
     }
 
-    // Execute and fetch results
-    std::vector<Row> rows;
-    while ((rc = sqlite3_step(stmt)) == SQLITE_ROW) {
-        std::vector<Value> values;
-        values.reserve(col_count);
+    bool cacheable = !is_schema_statement(sql);
+    if (is_ddl_statement(sql)) {
+        impl_->statements.clear();
+    }
+    if (!cacheable) {
+        impl_->query_cache.clear();
+    }
 
-        for (int i = 0; i < col_count; ++i) {
-            int type = sqlite3_column_type(stmt, i);
-            switch (type) {
-            case SQLITE_INTEGER:
-                values.emplace_back(sqlite3_column_int64(stmt, i));
-                break;
-            case SQLITE_FLOAT:
-                values.emplace_back(sqlite3_column_double(stmt, i));
-                break;
-            case SQLITE_TEXT: {
-                const char* text = reinterpret_cast<const char*>(sqlite3_column_text(stmt, i));
-                values.emplace_back(std::string(text ? text : ""));
-                break;
-            }
-            case SQLITE_BLOB: {
-                const uint8_t* data = reinterpret_cast<const uint8_t*>(sqlite3_column_blob(stmt, i));
-                int size = sqlite3_column_bytes(stmt, i);
-                values.emplace_back(std::vector<uint8_t>(data, data + size));
-                break;
-            }
-            case SQLITE_NULL:
-            default:
-                values.emplace_back(nullptr);
-                break;
-            }
+    // A single transaction for the whole batch instead of one journal flush per row; inside a caller's
+    // transaction the savepoint still undoes the whole batch on failure
+    BatchSavepoint savepoint(impl_->db);
+
+    // Prepare once, then reset and rebind for every parameter row
+    PreparedStatement prepared = cacheable ? impl_->statements.acquire(sql) : PreparedStatement{};
+    sqlite3_stmt*& stmt = prepared.stmt;
+    if (!stmt) {
+        int rc =
+            sqlite3_prepare_v3(impl_->db, sql.c_str(), -1, cacheable ? SQLITE_PREPARE_PERSISTENT : 0, &stmt, nullptr);
+        if (rc != SQLITE_OK) {
+            throw std::runtime_error("Failed to prepare statement: " + std::string(sqlite3_errmsg(impl_->db)));
         }
-        rows.emplace_back(std::move(values));
+        prepared.query = cacheable && is_query_statement(sql);
     }
+    impl_->invalidate_query_cache(stmt);
 
-    sqlite3_finalize(stmt);
+    for (const auto& params : params_list) {
+        bind_params(stmt, params);
 
-    if (rc != SQLITE_DONE) {
-        throw std::runtime_error("Failed to execute statement: " + std::string(sqlite3_errmsg(impl_->db)));
+        int rc;
+        while ((rc = sqlite3_step(stmt)) == SQLITE_ROW) {
+            // Rows returned by the statement are discarded
+        }
+
+        if (rc != SQLITE_DONE) {
+            std::string error = sqlite3_errmsg(impl_->db);
+            sqlite3_finalize(stmt);
+            throw std::runtime_error("Failed to execute statement: " + error);
+        }
+
+        sqlite3_reset(stmt);
+        sqlite3_clear_bindings(stmt);
+    }
+
+    if (cacheable) {
+        impl_->statements.release(sql, std::move(prepared));
+    } else {
+        sqlite3_finalize(stmt);
+    }
+
+    savepoint.release();
+}
+
+void Database::enable_query_cache(bool enabled) {
+    if (!impl_) {
+        return;
+    }
+    impl_->query_cache_enabled = enabled;
+    if (!enabled) {
+        impl_->query_cache.clear();
+    }
+}
+
+bool Database::query_cache_enabled() const {
+    return impl_ && impl_->query_cache_enabled;
+}
+
+struct ResultIterator::Impl {
+    StatementCache* statements = nullptr;  // nullptr when the statement is not cacheable
+    std::string sql;
+    std::vector<Value> params;  // owned: bound without copying, so it must outlive the statement's steps
+    PreparedStatement prepared;
+    std::shared_ptr<const std::vector<std::string>> columns;
+    int col_count = 0;
+    int rc = SQLITE_DONE;
+    bool started = false;
+
+    ~Impl() { finish(); }
+
+    // Returns the statement to the cache (or finalizes it) once iteration ends
+    void finish() {
+        if (!prepared.stmt) {
+            return;
+        }
+        if (statements) {
+            statements->release(sql, std::move(prepared));
+        } else {
+            sqlite3_finalize(prepared.stmt);
+        }
+        prepared.stmt = nullptr;
+    }
+};
+
+ResultIterator::ResultIterator(std::unique_ptr<Impl> impl) : impl_(std::move(impl)) {}
+
+ResultIterator::~ResultIterator() = default;
+
+ResultIterator::ResultIterator(ResultIterator&& other) noexcept = default;
+
+ResultIterator& ResultIterator::operator=(ResultIterator&& other) noexcept = default;
+
+const std::vector<std::string>& ResultIterator::columns() const {
+    static const std::vector<std::string> no_columns;
+    return impl_ && impl_->columns ? *impl_->columns : no_columns;
+}
+
+std::optional<Row> ResultIterator::next() {
+    if (!impl_ || !impl_->prepared.stmt) {
+        return std::nullopt;
+    }
+
+    // The first row was already stepped by iter_execute
+    sqlite3_stmt* stmt = impl_->prepared.stmt;
+    if (impl_->started) {
+        impl_->rc = sqlite3_step(stmt);
+    }
+    impl_->started = true;
+
+    if (impl_->rc == SQLITE_ROW) {
+        return read_row(stmt, impl_->col_count);
+    }
+
+    if (impl_->rc != SQLITE_DONE) {
+        std::string error = sqlite3_errmsg(sqlite3_db_handle(stmt));
+        sqlite3_finalize(stmt);
+        impl_->prepared.stmt = nullptr;
+        throw std::runtime_error("Failed to execute statement: " + error);
     }
 
-    return Result(std::move(columns), std::move(rows));
+    impl_->finish();
+    return std::nullopt;
+}
+
+ResultIterator Database::iter_execute(const std::string& sql) {
+    return iter_execute(sql, {});
+}
+
+ResultIterator Database::iter_execute(const std::string& sql, const std::vector<Value>& params) {
+    if (!is_open()) {
+        throw std::runtime_error("Database is not open");
+    }
+
+    auto iterator = std::make_unique<ResultIterator::Impl>();
+    iterator->sql = sql;
+    iterator->params = params;
+
+    bool cacheable = !is_schema_statement(sql);
+    if (is_ddl_statement(sql)) {
+        impl_->statements.clear();
+    }
+    if (!cacheable) {
+        impl_->query_cache.clear();
+    }
+    if (cacheable) {
+        iterator->statements = &impl_->statements;
+        iterator->prepared = impl_->statements.acquire(sql);
+    }
+
+    PreparedStatement& prepared = iterator->prepared;
+    if (!prepared.stmt) {
+        int rc = sqlite3_prepare_v3(impl_->db, sql.c_str(), -1, cacheable ? SQLITE_PREPARE_PERSISTENT : 0,
+                                    &prepared.stmt, nullptr);
+        if (rc != SQLITE_OK) {
+            throw std::runtime_error("Failed to prepare statement: " + std::string(sqlite3_errmsg(impl_->db)));
+        }
+        prepared.query = cacheable && is_query_statement(sql);
+    }
+    impl_->invalidate_query_cache(prepared.stmt);
+
+    // Step the first row now so errors surface here and the column names are known up front
+    bind_params(prepared.stmt, iterator->params);
+    iterator->rc = sqlite3_step(prepared.stmt);
+    if (iterator->rc != SQLITE_ROW && iterator->rc != SQLITE_DONE) {
+        std::string error = sqlite3_errmsg(impl_->db);
+        sqlite3_finalize(prepared.stmt);
+        prepared.stmt = nullptr;
+        throw std::runtime_error("Failed to execute statement: " + error);
+    }
+
+    refresh_columns(prepared);
+    iterator->columns = prepared.columns;
+    iterator->col_count = sqlite3_column_count(prepared.stmt);
+
+    return ResultIterator(std::move(iterator));
 }
 
 int64_t Database::last_insert_rowid() const {
@@ -243,15 +914,24 @@ int Database::changes() const {
 }
 
 void Database::begin_transaction() {
-    execute("BEGIN TRANSACTION");
+    if (!is_open()) {
+        throw std::runtime_error("Database is not open");
+    }
+    impl_->run_transaction_statement(impl_->begin_stmt, "begin");
 }
 
 void Database::commit() {
-    execute("COMMIT");
+    if (!is_open()) {
+        throw std::runtime_error("Database is not open");
+    }
+    impl_->run_transaction_statement(impl_->commit_stmt, "commit");
 }
 
 void Database::rollback() {
-    execute("ROLLBACK");
+    if (!is_open()) {
+        throw std::runtime_error("Database is not open");
+    }
+    impl_->run_transaction_statement(impl_->rollback_stmt, "rollback");
 }
 
 const std::string& Database::path() const {
@@ -265,8 +945,8 @@ std::string Database::error_message() const {
     return sqlite3_errmsg(impl_->db);
 }
 
-Database Database::from_schema(const std::string& database_path, const std::string& schema_path,
-                               LogLevel console_level) {
+Database Database::from_schema(const std::string& database_path, const std::string& schema_path, LogLevel console_level,
+                               bool performance_pragmas) {
     // Validate schema path before creating database
     if (!std::filesystem::exists(schema_path)) {
         throw std::runtime_error("Schema path does not exist: " + schema_path);
@@ -275,7 +955,7 @@ Database Database::from_schema(const std::string& database_path, const std::stri
         throw std::runtime_error("Schema path is not a directory: " + schema_path);
     }
 
-    Database db(database_path, console_level);
+    Database db(database_path, console_level, performance_pragmas);
     db.impl_->schema_path = schema_path;
 
     db.impl_->logger->info("Opening database from schema: db={}, schema={}", database_path, schema_path);
@@ -511,23 +1191,6 @@ std::vector<std::string> Database::get_time_series_tables(const std::string& col
     return tables;
 }
 
-std::vector<std::string> Database::get_table_columns(const std::string& table) const {
-    if (!is_open()) {
-        return {};
-    }
-
-    auto result = const_cast<Database*>(this)->execute("PRAGMA table_info(\"" + table + "\")");
-
-    std::vector<std::string> columns;
-    for (const auto& row : result) {
-        auto name = row.get_string(1);  // Column name is at index 1
-        if (name) {
-            columns.push_back(*name);
-        }
-    }
-    return columns;
-}
-
 std::vector<Database::ForeignKeyInfo> Database::get_foreign_keys(const std::string& table) const {
     if (!is_open()) {
         return {};
@@ -548,30 +1211,33 @@ std::vector<Database::ForeignKeyInfo> Database::get_foreign_keys(const std::stri
     return fks;
 }
 
-std::string Database::get_column_type(const std::string& table, const std::string& column) const {
+std::map<std::string, std::string> Database::get_column_types(const std::string& table) const {
     if (!is_open()) {
-        return "";
+        return {};
     }
 
     auto result = const_cast<Database*>(this)->execute("PRAGMA table_info(\"" + table + "\")");
 
+    std::map<std::string, std::string> types;
     for (const auto& row : result) {
         auto col_name = row.get_string(1);  // name is at index 1
-        if (col_name && *col_name == column) {
-            return row.get_string(2).value_or("");  // type is at index 2
+        if (col_name) {
+            types[*col_name] = row.get_string(2).value_or("");  // type is at index 2
         }
     }
-    return "";
+    return types;
 }
 
-void Database::validate_value_type(const std::string& table, const std::string& column, const Value& value) {
-    std::string col_type = get_column_type(table, column);
-    if (col_type.empty()) {
+void Database::validate_value_type(const std::map<std::string, std::string>& column_types,
+                                   const std::vector<ForeignKeyInfo>& fks, const std::string& column,
+                                   const Value& value) {
+    auto type_it = column_types.find(column);
+    if (type_it == column_types.end() || type_it->second.empty()) {
         return;  // Column not found, let SQLite handle it
     }
+    const std::string& col_type = type_it->second;
 
     // Skip validation for foreign key columns - they accept string labels that get resolved to IDs
-    auto fks = get_foreign_keys(table);
     for (const auto& fk : fks) {
         if (fk.column == column) {
             return;  // This is a FK column, skip type validation
@@ -634,10 +1300,8 @@ int64_t Database::get_element_id(const std::string& collection, const std::strin
     return *id;
 }
 
-Value Database::resolve_relation(const std::string& table, const std::string& column, const Value& value) {
-    // Get foreign key info for this column
-    auto fks = get_foreign_keys(table);
-
+Value Database::resolve_relation(const std::vector<ForeignKeyInfo>& fks, const std::string& column,
+                                 const Value& value) {
     for (const auto& fk : fks) {
         if (fk.column == column) {
             // This column is a foreign key
@@ -683,8 +1347,7 @@ void Database::insert_vectors(const std::string& collection, int64_t element_id,
     std::set<std::string> is_set_table;
 
     for (const auto& table : vector_tables) {
-        auto columns = get_table_columns(table);
-        for (const auto& col : columns) {
+        for (const auto& [col, type] : impl_->table_info(*this, table).column_types) {
             if (col != "id" && col != "vector_index") {
                 column_to_table[col] = table;
             }
@@ -693,8 +1356,7 @@ void Database::insert_vectors(const std::string& collection, int64_t element_id,
 
     for (const auto& table : set_tables) {
         is_set_table.insert(table);
-        auto columns = get_table_columns(table);
-        for (const auto& col : columns) {
+        for (const auto& [col, type] : impl_->table_info(*this, table).column_types) {
             if (col != "id") {
                 column_to_table[col] = table;
             }
@@ -732,37 +1394,40 @@ void Database::insert_vectors(const std::string& collection, int64_t element_id,
         }
 
         // Resolve relations for this table
+        const auto& fks = impl_->table_info(*this, table).foreign_keys;
         std::vector<std::pair<std::string, Value>> resolved_fields;
         for (const auto& [name, value] : fields) {
-            resolved_fields.emplace_back(name, resolve_relation(table, name, value));
+            resolved_fields.emplace_back(name, resolve_relation(fks, name, value));
         }
 
-        // Get table columns to determine column order
-        auto columns = get_table_columns(table);
+        // Build the INSERT once; every vector index binds a new row of values
+        std::string sql;
+        std::string placeholders;
+        if (is_set) {
+            // Set tables don't have vector_index
+            sql = "INSERT INTO \"" + table + "\" (id";
+            placeholders = "?";
+        } else {
+            // Vector tables have vector_index
+            sql = "INSERT INTO \"" + table + "\" (id, vector_index";
+            placeholders = "?, ?";
+        }
+        for (const auto& [name, value] : resolved_fields) {
+            sql += ", \"" + name + "\"";
+            placeholders += ", ?";
+        }
+        sql += ") VALUES (" + placeholders + ")";
 
-        // Insert one row per vector index
+        std::vector<std::vector<Value>> rows;
+        rows.reserve(vec_size);
         for (size_t i = 0; i < vec_size; ++i) {
-            std::string sql;
-            std::string placeholders;
             std::vector<Value> values;
-
-            if (is_set) {
-                // Set tables don't have vector_index
-                sql = "INSERT INTO \"" + table + "\" (id";
-                placeholders = "?";
-                values.push_back(element_id);
-            } else {
-                // Vector tables have vector_index
-                sql = "INSERT INTO \"" + table + "\" (id, vector_index";
-                placeholders = "?, ?";
-                values.push_back(element_id);
+            values.push_back(element_id);
+            if (!is_set) {
                 values.push_back(static_cast<int64_t>(i + 1));  // 1-indexed
             }
 
             for (const auto& [name, value] : resolved_fields) {
-                sql += ", \"" + name + "\"";
-                placeholders += ", ?";
-
                 Value elem = get_vector_element(value, i);
                 // Handle sentinel value for NULL
                 if (std::holds_alternative<int64_t>(elem)) {
@@ -776,10 +1441,10 @@ void Database::insert_vectors(const std::string& collection, int64_t element_id,
                     values.push_back(elem);
                 }
             }
-
-            sql += ") VALUES (" + placeholders + ")";
-            execute(sql, values);
+            rows.push_back(std::move(values));
         }
+
+        execute_many(sql, rows);
     }
 }
 
@@ -789,6 +1454,8 @@ void Database::insert_time_series(const std::string& collection, int64_t element
         return;
     }
 
+    auto ts_tables = get_time_series_tables(collection);
+
     for (const auto& [group, data] : time_series) {
         if (data.empty()) {
             continue;
@@ -797,7 +1464,6 @@ void Database::insert_time_series(const std::string& collection, int64_t element
         std::string table = collection + "_time_series_" + group;
 
         // Check if table exists
-        auto ts_tables = get_time_series_tables(collection);
         bool found = false;
         for (const auto& t : ts_tables) {
             if (t == table) {
@@ -827,22 +1493,29 @@ void Database::insert_time_series(const std::string& collection, int64_t element
             }
         }
 
-        // Insert each row
+        // Build the INSERT once; every row binds a new set of values
+        std::string sql = "INSERT INTO \"" + table + "\" (id";
+        std::string placeholders = "?";
+        for (const auto& [col, col_values] : data) {
+            sql += ", \"" + col + "\"";
+            placeholders += ", ?";
+        }
+        sql += ") VALUES (" + placeholders + ")";
+
+        std::vector<std::vector<Value>> rows;
+        rows.reserve(row_count);
         for (size_t i = 0; i < row_count; ++i) {
-            std::string sql = "INSERT INTO \"" + table + "\" (id";
-            std::string placeholders = "?";
             std::vector<Value> values;
+            values.reserve(data.size() + 1);
             values.push_back(element_id);
 
             for (const auto& [col, col_values] : data) {
-                sql += ", \"" + col + "\"";
-                placeholders += ", ?";
                 values.push_back(to_scalar_value(col_values[i]));
             }
-
-            sql += ") VALUES (" + placeholders + ")";
-            execute(sql, values);
+            rows.push_back(std::move(values));
         }
+
+        execute_many(sql, rows);
     }
 }
 
@@ -868,14 +1541,17 @@ int64_t Database::create_element(const std::string& table, const std::vector<std
     std::vector<std::pair<std::string, Value>> scalar_fields;
     std::vector<std::pair<std::string, Value>> vector_fields;
 
+    // Column types and foreign keys come from the cached insert plan for this table
+    const auto& info = impl_->table_info(*this, table);
+
     for (const auto& [name, value] : fields) {
         if (is_vector_value(value)) {
             vector_fields.emplace_back(name, value);
         } else {
             // Validate type before resolving relations
-            validate_value_type(table, name, value);
+            validate_value_type(info.column_types, info.foreign_keys, name, value);
             // Resolve scalar relations (string to ID for FK columns)
-            scalar_fields.emplace_back(name, resolve_relation(table, name, value));
+            scalar_fields.emplace_back(name, resolve_relation(info.foreign_keys, name, value));
         }
     }
 
@@ -908,9 +1584,7 @@ int64_t Database::create_element(const std::string& table, const std::vector<std
     }
 
     // Execute the insert
-    execute(sql, values);
-
-    int64_t element_id = last_insert_rowid();
+    int64_t element_id = execute(sql, values).last_insert_rowid();
 
     // Insert vector fields
     insert_vectors(table, element_id, vector_fields);
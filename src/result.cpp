@@ -47,6 +47,16 @@ std::optional<std::string> Row::get_string(size_t index) const {
     return std::nullopt;
 }
 
+std::optional<std::string_view> Row::get_string_view(size_t index) const {
+    if (index >= values_.size() || is_null(index)) {
+        return std::nullopt;
+    }
+    if (auto* val = std::get_if<std::string>(&values_[index])) {
+        return std::string_view(*val);
+    }
+    return std::nullopt;
+}
+
 std::optional<std::vector<uint8_t>> Row::get_blob(size_t index) const {
     if (index >= values_.size() || is_null(index)) {
         return std::nullopt;
@@ -64,30 +74,61 @@ bool Row::is_null(size_t index) const {
     return std::holds_alternative<std::nullptr_t>(values_[index]);
 }
 
+namespace {
+
+std::shared_ptr<const std::vector<Row>> share_rows(std::vector<Row> rows) {
+    if (rows.empty()) {
+        return nullptr;
+    }
+    return std::make_shared<const std::vector<Row>>(std::move(rows));
+}
+
+}  // anonymous namespace
+
 Result::Result(std::vector<std::string> columns, std::vector<Row> rows)
-    : columns_(std::move(columns)), rows_(std::move(rows)) {}
+    : columns_(std::make_shared<const std::vector<std::string>>(std::move(columns))),
+      rows_(share_rows(std::move(rows))) {}
+
+Result::Result(std::shared_ptr<const std::vector<std::string>> columns, std::vector<Row> rows,
+               int64_t last_insert_rowid, int64_t changes)
+    : columns_(std::move(columns)), rows_(share_rows(std::move(rows))), last_insert_rowid_(last_insert_rowid),
+      changes_(changes) {}
+
+const std::vector<Row>& Result::rows() const {
+    static const std::vector<Row> no_rows;
+    return rows_ ? *rows_ : no_rows;
+}
 
 bool Result::empty() const {
-    return rows_.empty();
+    return rows().empty();
 }
 
 size_t Result::row_count() const {
-    return rows_.size();
+    return rows().size();
 }
 
 size_t Result::column_count() const {
-    return columns_.size();
+    return columns_ ? columns_->size() : 0;
 }
 
 const std::vector<std::string>& Result::columns() const {
-    return columns_;
+    static const std::vector<std::string> no_columns;
+    return columns_ ? *columns_ : no_columns;
 }
 
 const Row& Result::operator[](size_t index) const {
-    if (index >= rows_.size()) {
+    if (index >= row_count()) {
         throw std::out_of_range("Row index out of range");
     }
-    return rows_[index];
+    return (*rows_)[index];
+}
+
+int64_t Result::last_insert_rowid() const {
+    return last_insert_rowid_;
+}
+
+int64_t Result::changes() const {
+    return changes_;
 }
 
 }  // namespace psr
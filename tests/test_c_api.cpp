@@ -1,3 +1,5 @@
+#include "test_utils.h"
+
 #include <cstdio>
 #include <filesystem>
 #include <fstream>
@@ -9,7 +11,7 @@ namespace fs = std::filesystem;
 
 class CApiTest : public ::testing::Test {
 protected:
-    void SetUp() override { test_db_path_ = (fs::temp_directory_path() / "psr_c_test.db").string(); }
+    void SetUp() override { test_db_path_ = (psr_test::temp_directory() / "psr_c_test.db").string(); }
 
     void TearDown() override {
         if (fs::exists(test_db_path_)) {
@@ -41,6 +43,31 @@ TEST_F(CApiTest, OpenInMemory) {
     psr_database_close(db);
 }
 
+TEST_F(CApiTest, OpenWithoutPerformancePragmas) {
+    psr_error_t error;
+    psr_database_t* db = psr_database_open_ex(test_db_path_.c_str(), PSR_LOG_OFF, 0, &error);
+    ASSERT_NE(db, nullptr);
+    EXPECT_EQ(error, PSR_OK);
+
+    // The file keeps its rollback journal
+    psr_result_t* result = psr_database_execute(db, "PRAGMA journal_mode", &error);
+    ASSERT_NE(result, nullptr);
+    EXPECT_STREQ(psr_result_get_string(result, 0, 0), "delete");
+    psr_result_free(result);
+    psr_database_close(db);
+
+    db = psr_database_open_ex(test_db_path_.c_str(), PSR_LOG_OFF, 1, &error);
+    ASSERT_NE(db, nullptr);
+    result = psr_database_execute(db, "PRAGMA journal_mode", &error);
+    ASSERT_NE(result, nullptr);
+    EXPECT_STREQ(psr_result_get_string(result, 0, 0), "wal");
+    psr_result_free(result);
+    psr_database_close(db);
+
+    EXPECT_EQ(psr_database_open_ex(nullptr, PSR_LOG_OFF, 0, &error), nullptr);
+    EXPECT_EQ(error, PSR_ERROR_INVALID_ARGUMENT);
+}
+
 TEST_F(CApiTest, OpenNullPath) {
     psr_error_t error;
     psr_database_t* db = psr_database_open(nullptr, PSR_LOG_OFF, &error);
@@ -102,6 +129,70 @@ TEST_F(CApiTest, InsertAndSelect) {
     psr_database_close(db);
 }
 
+TEST_F(CApiTest, ExecuteUncached) {
+    psr_error_t error;
+    psr_database_t* db = psr_database_open(":memory:", PSR_LOG_OFF, &error);
+    ASSERT_NE(db, nullptr);
+
+    psr_result_t* r1 = psr_database_execute_uncached(db, "CREATE TABLE items (id INTEGER PRIMARY KEY)", &error);
+    EXPECT_EQ(error, PSR_OK);
+    psr_result_free(r1);
+
+    psr_result_t* result = psr_database_execute_uncached(db, "SELECT name FROM sqlite_master", &error);
+    ASSERT_NE(result, nullptr);
+    EXPECT_EQ(psr_result_row_count(result), 1u);
+    EXPECT_STREQ(psr_result_get_string(result, 0, 0), "items");
+    psr_result_free(result);
+
+    EXPECT_EQ(psr_database_execute_uncached(db, "INVALID SQL", &error), nullptr);
+    EXPECT_EQ(error, PSR_ERROR_QUERY);
+
+    EXPECT_EQ(psr_database_execute_uncached(nullptr, "SELECT 1", &error), nullptr);
+    EXPECT_EQ(error, PSR_ERROR_INVALID_ARGUMENT);
+
+    psr_database_close(db);
+}
+
+TEST_F(CApiTest, ResultWriteInfo) {
+    psr_error_t error;
+    psr_database_t* db = psr_database_open(":memory:", PSR_LOG_OFF, &error);
+    ASSERT_NE(db, nullptr);
+
+    psr_result_free(psr_database_execute(db, "CREATE TABLE items (id INTEGER PRIMARY KEY)", &error));
+    psr_result_t* result = psr_database_execute(db, "INSERT INTO items (id) VALUES (7), (8)", &error);
+    ASSERT_NE(result, nullptr);
+    EXPECT_EQ(psr_result_last_insert_rowid(result), 8);
+    EXPECT_EQ(psr_result_changes(result), 2);
+    psr_result_free(result);
+
+    EXPECT_EQ(psr_result_last_insert_rowid(nullptr), 0);
+    EXPECT_EQ(psr_result_changes(nullptr), 0);
+
+    psr_database_close(db);
+}
+
+TEST_F(CApiTest, QueryCache) {
+    psr_error_t error;
+    psr_database_t* db = psr_database_open(":memory:", PSR_LOG_OFF, &error);
+    ASSERT_NE(db, nullptr);
+
+    EXPECT_EQ(psr_database_enable_query_cache(db, 1), PSR_OK);
+    psr_result_free(psr_database_execute(db, "CREATE TABLE items (id INTEGER PRIMARY KEY)", &error));
+    psr_result_free(psr_database_execute(db, "SELECT COUNT(*) FROM items", &error));
+    psr_result_free(psr_database_execute(db, "INSERT INTO items DEFAULT VALUES", &error));
+
+    psr_result_t* result = psr_database_execute(db, "SELECT COUNT(*) FROM items", &error);
+    ASSERT_NE(result, nullptr);
+    int64_t count = 0;
+    EXPECT_EQ(psr_result_get_int(result, 0, 0, &count), PSR_OK);
+    EXPECT_EQ(count, 1);
+    psr_result_free(result);
+
+    EXPECT_EQ(psr_database_enable_query_cache(nullptr, 1), PSR_ERROR_INVALID_ARGUMENT);
+
+    psr_database_close(db);
+}
+
 TEST_F(CApiTest, ValueTypes) {
     psr_error_t error;
     psr_database_t* db = psr_database_open(":memory:", PSR_LOG_OFF, &error);
@@ -136,6 +227,83 @@ TEST_F(CApiTest, ValueTypes) {
     psr_database_close(db);
 }
 
+TEST_F(CApiTest, FetchAll) {
+    psr_error_t error;
+    psr_database_t* db = psr_database_open(":memory:", PSR_LOG_OFF, &error);
+    ASSERT_NE(db, nullptr);
+
+    psr_result_free(psr_database_execute(db, "CREATE TABLE types (i INTEGER, f REAL, t TEXT, b BLOB)", &error));
+    psr_result_free(psr_database_execute(db, "INSERT INTO types VALUES (1, 1.5, 'one', x'0102')", &error));
+    psr_result_free(psr_database_execute(db, "INSERT INTO types VALUES (2, NULL, 'two', NULL)", &error));
+
+    psr_result_t* result = psr_database_execute(db, "SELECT * FROM types ORDER BY i", &error);
+    ASSERT_NE(result, nullptr);
+
+    psr_value_t values[8];
+    EXPECT_EQ(psr_result_fetch_all(result, values, 7), PSR_ERROR_INDEX_OUT_OF_RANGE);
+    ASSERT_EQ(psr_result_fetch_all(result, values, 8), PSR_OK);
+
+    EXPECT_EQ(values[0].type, PSR_TYPE_INTEGER);
+    EXPECT_EQ(values[0].int_value, 1);
+    EXPECT_EQ(values[1].type, PSR_TYPE_FLOAT);
+    EXPECT_DOUBLE_EQ(values[1].double_value, 1.5);
+    EXPECT_EQ(values[2].type, PSR_TYPE_TEXT);
+    EXPECT_STREQ(values[2].string_value, "one");
+    EXPECT_EQ(values[3].type, PSR_TYPE_BLOB);
+    ASSERT_EQ(values[3].blob_size, 2u);
+    EXPECT_EQ(values[3].blob_value[1], 0x02);
+
+    EXPECT_EQ(values[4].int_value, 2);
+    EXPECT_EQ(values[5].type, PSR_TYPE_NULL);
+    EXPECT_STREQ(values[6].string_value, "two");
+    EXPECT_EQ(values[7].type, PSR_TYPE_NULL);
+
+    EXPECT_EQ(psr_result_fetch_all(nullptr, values, 8), PSR_ERROR_INVALID_ARGUMENT);
+
+    psr_result_free(result);
+    psr_database_close(db);
+}
+
+TEST_F(CApiTest, ColumnAccess) {
+    psr_error_t error;
+    psr_database_t* db = psr_database_open(":memory:", PSR_LOG_OFF, &error);
+    ASSERT_NE(db, nullptr);
+
+    psr_result_free(psr_database_execute(db, "CREATE TABLE data (i INTEGER, f REAL, t TEXT)", &error));
+    psr_result_free(psr_database_execute(db, "INSERT INTO data VALUES (1, 0.5, 'a')", &error));
+    psr_result_free(psr_database_execute(db, "INSERT INTO data VALUES (NULL, 2, 'b')", &error));
+    psr_result_free(psr_database_execute(db, "INSERT INTO data VALUES (3, NULL, 'c')", &error));
+
+    psr_result_t* result = psr_database_execute(db, "SELECT * FROM data", &error);
+    ASSERT_NE(result, nullptr);
+
+    int64_t ints[3];
+    uint8_t int_nulls[3];
+    ASSERT_EQ(psr_result_get_int_column(result, 0, ints, int_nulls, 3), PSR_OK);
+    EXPECT_EQ(ints[0], 1);
+    EXPECT_EQ(int_nulls[0], 0);
+    EXPECT_EQ(int_nulls[1], 1);
+    EXPECT_EQ(ints[2], 3);
+
+    double doubles[3];
+    uint8_t double_nulls[3];
+    ASSERT_EQ(psr_result_get_double_column(result, 1, doubles, double_nulls, 3), PSR_OK);
+    EXPECT_DOUBLE_EQ(doubles[0], 0.5);
+    EXPECT_DOUBLE_EQ(doubles[1], 2.0);
+    EXPECT_EQ(double_nulls[2], 1);
+
+    // Nulls mask is optional
+    EXPECT_EQ(psr_result_get_double_column(result, 1, doubles, nullptr, 3), PSR_OK);
+
+    EXPECT_EQ(psr_result_get_int_column(result, 0, ints, nullptr, 2), PSR_ERROR_INDEX_OUT_OF_RANGE);
+    EXPECT_EQ(psr_result_get_int_column(result, 5, ints, nullptr, 3), PSR_ERROR_INDEX_OUT_OF_RANGE);
+    EXPECT_EQ(psr_result_get_int_column(result, 2, ints, nullptr, 3), PSR_ERROR_INVALID_ARGUMENT);
+    EXPECT_EQ(psr_result_get_double_column(result, 2, doubles, nullptr, 3), PSR_ERROR_INVALID_ARGUMENT);
+
+    psr_result_free(result);
+    psr_database_close(db);
+}
+
 TEST_F(CApiTest, Transaction) {
     psr_error_t error;
     psr_database_t* db = psr_database_open(":memory:", PSR_LOG_OFF, &error);
@@ -222,8 +390,8 @@ TEST_F(CApiTest, IndexOutOfRange) {
 class CApiMigrationTest : public ::testing::Test {
 protected:
     void SetUp() override {
-        test_db_path_ = (fs::temp_directory_path() / "psr_c_migration_test.db").string();
-        test_schema_path_ = fs::temp_directory_path() / "psr_c_test_schema";
+        test_db_path_ = (psr_test::temp_directory() / "psr_c_migration_test.db").string();
+        test_schema_path_ = psr_test::temp_directory() / "psr_c_test_schema";
 
         // Clean up from previous runs
         if (fs::exists(test_db_path_)) {
@@ -278,6 +446,23 @@ TEST_F(CApiMigrationTest, FromSchemaBasic) {
     psr_database_close(db);
 }
 
+TEST_F(CApiMigrationTest, FromSchemaWithoutPerformancePragmas) {
+    create_migration(1, "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT);");
+
+    psr_error_t error;
+    psr_database_t* db =
+        psr_database_from_schema_ex(test_db_path_.c_str(), test_schema_path_.string().c_str(), PSR_LOG_OFF, 0, &error);
+    ASSERT_NE(db, nullptr);
+    EXPECT_EQ(error, PSR_OK);
+    EXPECT_EQ(psr_database_current_version(db), 1);
+
+    psr_result_t* result = psr_database_execute(db, "PRAGMA journal_mode", &error);
+    ASSERT_NE(result, nullptr);
+    EXPECT_STREQ(psr_result_get_string(result, 0, 0), "delete");
+    psr_result_free(result);
+    psr_database_close(db);
+}
+
 TEST_F(CApiMigrationTest, FromSchemaEmpty) {
     psr_error_t error;
     psr_database_t* db =
@@ -1,15 +1,20 @@
+#include "test_utils.h"
+
+#include <chrono>
 #include <cstdio>
 #include <filesystem>
 #include <fstream>
 #include <gtest/gtest.h>
 #include <psr/database.h>
 #include <string>
+#include <thread>
+#include <vector>
 
 namespace fs = std::filesystem;
 
 class DatabaseTest : public ::testing::Test {
 protected:
-    void SetUp() override { test_db_path_ = (fs::temp_directory_path() / "psr_test.db").string(); }
+    void SetUp() override { test_db_path_ = (psr_test::temp_directory() / "psr_test.db").string(); }
 
     void TearDown() override {
         if (fs::exists(test_db_path_)) {
@@ -34,6 +39,26 @@ TEST_F(DatabaseTest, OpenInMemory) {
     EXPECT_TRUE(db.is_open());
 }
 
+TEST_F(DatabaseTest, PerformancePragmas) {
+    {
+        psr::Database db(test_db_path_, psr::LogLevel::off);
+        EXPECT_EQ(db.execute("PRAGMA journal_mode")[0].get_string(0), "wal");
+        EXPECT_EQ(db.execute("PRAGMA synchronous")[0].get_int(0), 1);  // NORMAL
+        EXPECT_EQ(db.execute("PRAGMA temp_store")[0].get_int(0), 2);   // MEMORY
+        EXPECT_EQ(db.execute("PRAGMA cache_size")[0].get_int(0), -65536);
+    }
+
+    psr::Database memory_db(":memory:", psr::LogLevel::off);
+    EXPECT_EQ(memory_db.execute("PRAGMA journal_mode")[0].get_string(0), "memory");
+    EXPECT_EQ(memory_db.execute("PRAGMA temp_store")[0].get_int(0), 2);
+}
+
+TEST_F(DatabaseTest, PerformancePragmasOptOut) {
+    psr::Database db(test_db_path_, psr::LogLevel::off, false);
+    EXPECT_EQ(db.execute("PRAGMA journal_mode")[0].get_string(0), "delete");
+    EXPECT_EQ(db.execute("PRAGMA synchronous")[0].get_int(0), 2);  // FULL
+}
+
 TEST_F(DatabaseTest, CreateTable) {
     psr::Database db(test_db_path_);
 
@@ -71,6 +96,45 @@ TEST_F(DatabaseTest, InsertAndSelect) {
     EXPECT_EQ(result[1].get_int(2), 25);
 }
 
+TEST_F(DatabaseTest, ResultCarriesWriteInfo) {
+    psr::Database db(":memory:");
+
+    auto create = db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)");
+    EXPECT_EQ(create.changes(), 0);
+
+    auto insert = db.execute("INSERT INTO users (name) VALUES ('Alice'), ('Bob')");
+    EXPECT_EQ(insert.last_insert_rowid(), 2);
+    EXPECT_EQ(insert.changes(), 2);
+
+    auto update = db.execute("UPDATE users SET name = 'Carol' WHERE id = 1");
+    EXPECT_EQ(update.last_insert_rowid(), 0);
+    EXPECT_EQ(update.changes(), 1);
+
+    auto replace = db.execute("REPLACE INTO users (id, name) VALUES (5, 'Dave')");
+    EXPECT_EQ(replace.last_insert_rowid(), 5);
+    EXPECT_EQ(db.execute("DELETE FROM users WHERE id = 5").last_insert_rowid(), 0);
+
+    // An upsert that updates inserts nothing; a CTE-prefixed INSERT does insert
+    auto upsert = db.execute("INSERT INTO users (id, name) VALUES (1, 'Eve') ON CONFLICT (id) DO UPDATE SET name = "
+                             "excluded.name");
+    EXPECT_EQ(upsert.last_insert_rowid(), 0);
+    EXPECT_EQ(upsert.changes(), 1);
+    auto cte_insert = db.execute("WITH names (name) AS (VALUES ('Frank')) INSERT INTO users (name) SELECT name FROM "
+                                 "names");
+    EXPECT_EQ(cte_insert.last_insert_rowid(), 3);
+    EXPECT_EQ(db.last_insert_rowid(), 3);
+    db.execute("UPDATE users SET name = 'Grace' WHERE id = 3");
+    EXPECT_EQ(db.last_insert_rowid(), 3);
+
+    // Statements that touch no rows do not report the previous statement's counts
+    EXPECT_EQ(db.execute("DELETE FROM users WHERE id = 42").changes(), 0);
+    EXPECT_EQ(db.execute("CREATE INDEX users_name ON users (name)").changes(), 0);
+
+    auto select = db.execute("SELECT * FROM users");
+    EXPECT_EQ(select.last_insert_rowid(), 0);
+    EXPECT_EQ(select.changes(), 0);
+}
+
 TEST_F(DatabaseTest, ParameterizedQuery) {
     psr::Database db(":memory:");
 
@@ -129,6 +193,24 @@ TEST_F(DatabaseTest, TransactionCommit) {
     EXPECT_EQ(result[0].get_int(0), 42);
 }
 
+TEST_F(DatabaseTest, TransactionErrors) {
+    psr::Database db(":memory:");
+
+    EXPECT_THROW(db.commit(), std::runtime_error);
+    EXPECT_THROW(db.rollback(), std::runtime_error);
+
+    db.begin_transaction();
+    EXPECT_THROW(db.begin_transaction(), std::runtime_error);
+    db.rollback();
+
+    // The prepared statements are reset after failures and remain usable
+    db.begin_transaction();
+    db.commit();
+
+    db.close();
+    EXPECT_THROW(db.begin_transaction(), std::runtime_error);
+}
+
 TEST_F(DatabaseTest, BlobData) {
     psr::Database db(":memory:");
 
@@ -145,6 +227,24 @@ TEST_F(DatabaseTest, BlobData) {
     EXPECT_EQ(*retrieved, blob_data);
 }
 
+TEST_F(DatabaseTest, TextAndBlobParameters) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE data (id INTEGER PRIMARY KEY, text TEXT, blob BLOB)");
+
+    std::string large_text(1 << 20, 'x');
+    std::vector<uint8_t> large_blob(1 << 20, 0xAB);
+    db.execute("INSERT INTO data (text, blob) VALUES (?, ?)", {psr::Value{large_text}, psr::Value{large_blob}});
+    db.execute("INSERT INTO data (text, blob) VALUES (?, ?)", {psr::Value{std::string{}}, psr::Value{nullptr}});
+
+    auto result = db.execute("SELECT text, blob FROM data ORDER BY id");
+    ASSERT_EQ(result.row_count(), 2u);
+    EXPECT_EQ(result[0].get_string(0), large_text);
+    EXPECT_EQ(result[0].get_blob(1), large_blob);
+    EXPECT_EQ(result[1].get_string(0), "");
+    EXPECT_TRUE(result[1].is_null(1));
+}
+
 TEST_F(DatabaseTest, MoveSemantics) {
     psr::Database db1(":memory:");
     db1.execute("CREATE TABLE test (id INTEGER)");
@@ -181,12 +281,417 @@ TEST_F(DatabaseTest, ResultIteration) {
     EXPECT_EQ(expected, 6);
 }
 
+TEST_F(DatabaseTest, IterExecute) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE numbers (n INTEGER, label TEXT)");
+    for (int64_t i = 1; i <= 5; ++i) {
+        db.execute("INSERT INTO numbers (n, label) VALUES (?, ?)", {psr::Value{i}, psr::Value{std::to_string(i)}});
+    }
+
+    auto rows = db.iter_execute("SELECT n, label FROM numbers WHERE n >= ? ORDER BY n", {psr::Value{int64_t{2}}});
+    EXPECT_EQ(rows.columns(), (std::vector<std::string>{"n", "label"}));
+
+    int64_t expected = 2;
+    while (auto row = rows.next()) {
+        EXPECT_EQ(row->get_int(0), expected);
+        EXPECT_EQ(row->get_string(1), std::to_string(expected));
+        ++expected;
+    }
+    EXPECT_EQ(expected, 6);
+    EXPECT_FALSE(rows.next().has_value());
+
+    // The statement went back to the cache and can be reused
+    auto again = db.iter_execute("SELECT n, label FROM numbers WHERE n >= ? ORDER BY n", {psr::Value{int64_t{5}}});
+    EXPECT_EQ(again.next()->get_int(0), 5);
+}
+
+TEST_F(DatabaseTest, IterExecuteAbandonedEarly) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE numbers (n INTEGER)");
+    db.execute("INSERT INTO numbers (n) VALUES (1), (2), (3)");
+
+    {
+        auto rows = db.iter_execute("SELECT n FROM numbers ORDER BY n");
+        EXPECT_EQ(rows.next()->get_int(0), 1);
+
+        // Other statements may run on the connection while the iterator is open
+        EXPECT_EQ(db.execute("SELECT n FROM numbers ORDER BY n").row_count(), 3u);
+    }
+
+    // Destroying the iterator mid-query reset its statement
+    auto result = db.execute("SELECT n FROM numbers ORDER BY n");
+    EXPECT_EQ(result.row_count(), 3u);
+    db.execute("DROP TABLE numbers");
+}
+
+TEST_F(DatabaseTest, IterExecuteDestroyedAfterClose) {
+    psr::Database db(test_db_path_, psr::LogLevel::off);
+    db.execute("CREATE TABLE numbers (n INTEGER)");
+    db.execute("INSERT INTO numbers (n) VALUES (1), (2)");
+
+    {
+        auto rows = db.iter_execute("SELECT n FROM numbers ORDER BY n");
+        EXPECT_EQ(rows.next()->get_int(0), 1);
+        db.close();
+        EXPECT_FALSE(db.is_open());
+    }
+
+    // Releasing the iterator's statement completed the close, so no lock or WAL file is left behind
+    EXPECT_FALSE(fs::exists(test_db_path_ + "-wal"));
+    psr::Database other(test_db_path_, psr::LogLevel::off, false);
+    EXPECT_EQ(other.execute("PRAGMA journal_mode = DELETE")[0].get_string(0), "delete");
+}
+
+TEST_F(DatabaseTest, IterExecuteErrors) {
+    psr::Database db(":memory:");
+
+    EXPECT_THROW(db.iter_execute("INVALID SQL STATEMENT"), std::runtime_error);
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)");
+    db.execute("INSERT INTO items (id) VALUES (1)");
+    EXPECT_THROW(db.iter_execute("INSERT INTO items (id) VALUES (1)"), std::runtime_error);
+
+    auto insert = db.iter_execute("INSERT INTO items (id) VALUES (2)");
+    EXPECT_FALSE(insert.next().has_value());
+    EXPECT_EQ(db.execute("SELECT COUNT(*) FROM items")[0].get_int(0), 2);
+}
+
+TEST_F(DatabaseTest, RepeatedQueryWithDifferentParams) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    db.execute("INSERT INTO items (name) VALUES (?)", {psr::Value{"first"}});
+    db.execute("INSERT INTO items (name) VALUES (?)", {psr::Value{"second"}});
+
+    auto result1 = db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{1}}});
+    auto result2 = db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{2}}});
+    auto result3 = db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{3}}});
+
+    EXPECT_EQ(result1[0].get_string(0), "first");
+    EXPECT_EQ(result2[0].get_string(0), "second");
+    EXPECT_TRUE(result3.empty());
+}
+
+TEST_F(DatabaseTest, RepeatedQueryWithVaryingRowCounts) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE numbers (n INTEGER)");
+    std::vector<std::vector<psr::Value>> rows;
+    for (int64_t i = 1; i <= 1000; ++i) {
+        rows.push_back({psr::Value{i}});
+    }
+    db.execute_many("INSERT INTO numbers (n) VALUES (?)", rows);
+
+    const std::string sql = "SELECT n FROM numbers WHERE n <= ? ORDER BY n";
+    for (int64_t limit : {1000, 3, 0, 500}) {
+        auto result = db.execute(sql, {psr::Value{limit}});
+        ASSERT_EQ(result.row_count(), static_cast<size_t>(limit));
+        if (limit > 0) {
+            EXPECT_EQ(result[limit - 1].get_int(0), limit);
+        }
+    }
+}
+
+TEST_F(DatabaseTest, ReadOnlyPragmaKeepsCachedStatements) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    auto before = db.execute("SELECT id, name FROM items");
+
+    // A statement that stayed cached hands out the same column-name list
+    db.current_version();
+    db.execute("PRAGMA table_info(items)");
+    auto after = db.execute("SELECT id, name FROM items");
+    EXPECT_EQ(&before.columns(), &after.columns());
+
+    db.execute("CREATE TABLE other (id INTEGER)");
+    auto flushed = db.execute("SELECT id, name FROM items");
+    EXPECT_NE(&after.columns(), &flushed.columns());
+}
+
+TEST_F(DatabaseTest, SchemaChangeInvalidatesCachedStatements) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    db.execute("INSERT INTO items (name) VALUES ('a')");
+    EXPECT_EQ(db.execute("SELECT * FROM items").column_count(), 2u);
+
+    db.execute("ALTER TABLE items ADD COLUMN price REAL");
+
+    auto result = db.execute("SELECT * FROM items");
+    EXPECT_EQ(result.column_count(), 3u);
+    EXPECT_EQ(result.columns()[2], "price");
+}
+
+TEST_F(DatabaseTest, TextWithEmbeddedNul) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (name TEXT)");
+    std::string text("ab\0cd", 5);
+    db.execute("INSERT INTO items (name) VALUES (?)", {psr::Value{text}});
+
+    auto result = db.execute("SELECT name FROM items");
+    EXPECT_EQ(result[0].get_string(0), text);
+    EXPECT_EQ(result[0].get_string_view(0)->size(), 5u);
+}
+
+TEST_F(DatabaseTest, CachedStatementSharesColumnNames) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    auto first = db.execute("SELECT id, name FROM items");
+    auto second = db.execute("SELECT id, name FROM items");
+
+    EXPECT_EQ(&first.columns(), &second.columns());
+    EXPECT_EQ(second.columns(), (std::vector<std::string>{"id", "name"}));
+}
+
+TEST_F(DatabaseTest, SchemaChangeFromOtherConnectionRefreshesColumnNames) {
+    psr::Database db(test_db_path_);
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    EXPECT_EQ(db.execute("SELECT * FROM items").column_count(), 2u);
+
+    {
+        psr::Database other(test_db_path_);
+        other.execute("ALTER TABLE items ADD COLUMN price REAL");
+    }
+
+    auto result = db.execute("SELECT * FROM items");
+    EXPECT_EQ(result.column_count(), 3u);
+    EXPECT_EQ(result.columns()[2], "price");
+}
+
+TEST_F(DatabaseTest, QueryCache) {
+    psr::Database db(":memory:");
+    EXPECT_FALSE(db.query_cache_enabled());
+    db.enable_query_cache();
+    EXPECT_TRUE(db.query_cache_enabled());
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    db.execute("INSERT INTO items (name) VALUES (?)", {psr::Value{"a"}});
+
+    auto first = db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{1}}});
+    auto cached = db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{1}}});
+    EXPECT_EQ(first[0].get_string(0), "a");
+    EXPECT_EQ(cached[0].get_string(0), "a");
+    // A hit shares the cached rows instead of copying them
+    EXPECT_EQ(&cached[0], &first[0]);
+
+    // Statements first prepared by iter_execute are still recognized as queries once cached
+    const std::string count = "SELECT COUNT(*) FROM items";
+    EXPECT_EQ(db.iter_execute(count).next()->get_int(0), 1);
+    auto counted = db.execute(count);
+    EXPECT_EQ(&db.execute(count)[0], &counted[0]);
+    EXPECT_TRUE(db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{2}}}).empty());
+
+    // Writes through execute and execute_many invalidate cached results
+    db.execute("UPDATE items SET name = 'b'");
+    EXPECT_EQ(db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{1}}})[0].get_string(0), "b");
+
+    db.execute_many("INSERT INTO items (name) VALUES (?)", {{psr::Value{"c"}}});
+    EXPECT_EQ(db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{2}}})[0].get_string(0), "c");
+
+    // Connection PRAGMAs are read-only statements but still change query results
+    const std::string like = "SELECT COUNT(*) FROM items WHERE name LIKE 'B'";
+    EXPECT_EQ(db.execute(like)[0].get_int(0), 1);
+    db.execute("PRAGMA case_sensitive_like = 1");
+    EXPECT_EQ(db.execute(like)[0].get_int(0), 0);
+
+    // So do ATTACH and DETACH
+    auto directory = psr_test::temp_directory();
+    std::vector<std::string> attached;
+    for (const std::string name : {"a", "b"}) {
+        attached.push_back((directory / ("psr_query_cache_" + name + ".db")).string());
+        psr::Database other(attached.back(), psr::LogLevel::off, false);
+        other.execute("DROP TABLE IF EXISTS t");
+        other.execute("CREATE TABLE t (v TEXT)");
+        other.execute("INSERT INTO t (v) VALUES (?)", {psr::Value{name}});
+    }
+
+    db.execute("ATTACH DATABASE ? AS x", {psr::Value{attached[0]}});
+    EXPECT_EQ(db.execute("SELECT v FROM x.t")[0].get_string(0), "a");
+    db.execute("DETACH DATABASE x");
+    db.execute("ATTACH DATABASE ? AS x", {psr::Value{attached[1]}});
+    EXPECT_EQ(db.execute("SELECT v FROM x.t")[0].get_string(0), "b");
+    db.execute("DETACH DATABASE x");
+    EXPECT_THROW(db.execute("SELECT v FROM x.t"), std::runtime_error);
+
+    for (const auto& path : attached) {
+        fs::remove(path);
+    }
+}
+
+TEST_F(DatabaseTest, QueryCacheIgnoresRolledBackReads) {
+    psr::Database db(":memory:");
+    db.enable_query_cache();
+
+    db.execute("CREATE TABLE counter (value INTEGER)");
+    db.execute("INSERT INTO counter (value) VALUES (0)");
+
+    db.begin_transaction();
+    db.execute("UPDATE counter SET value = 1");
+    EXPECT_EQ(db.execute("SELECT value FROM counter")[0].get_int(0), 1);
+    db.rollback();
+
+    EXPECT_EQ(db.execute("SELECT value FROM counter")[0].get_int(0), 0);
+
+    db.enable_query_cache(false);
+    EXPECT_FALSE(db.query_cache_enabled());
+}
+
+TEST_F(DatabaseTest, ExecuteUncached) {
+    psr::Database db(":memory:");
+
+    db.execute_uncached("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    db.execute_uncached("INSERT INTO items (name) VALUES (?)", {psr::Value{"Widget"}});
+
+    auto result = db.execute_uncached("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{1}}});
+    EXPECT_EQ(result.row_count(), 1u);
+    EXPECT_EQ(result[0].get_string(0), "Widget");
+
+    // Mixing cached and uncached executions of the same SQL
+    auto cached = db.execute("SELECT name FROM items WHERE id = ?", {psr::Value{int64_t{1}}});
+    EXPECT_EQ(cached[0].get_string(0), "Widget");
+
+    EXPECT_THROW(db.execute_uncached("INVALID SQL STATEMENT"), std::runtime_error);
+}
+
+TEST_F(DatabaseTest, ExecuteMany) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, price REAL)");
+
+    std::vector<std::vector<psr::Value>> rows;
+    for (int i = 1; i <= 5; ++i) {
+        rows.push_back({psr::Value{"item" + std::to_string(i)}, psr::Value{i * 1.5}});
+    }
+    db.execute_many("INSERT INTO items (name, price) VALUES (?, ?)", rows);
+
+    auto result = db.execute("SELECT name, price FROM items ORDER BY id");
+    ASSERT_EQ(result.row_count(), 5u);
+    for (size_t i = 0; i < 5; ++i) {
+        EXPECT_EQ(result[i].get_string(0), "item" + std::to_string(i + 1));
+        EXPECT_DOUBLE_EQ(*result[i].get_double(1), (i + 1) * 1.5);
+    }
+}
+
+TEST_F(DatabaseTest, ExecuteManyEmpty) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)");
+    db.execute_many("INSERT INTO items (name) VALUES (?)", {});
+
+    EXPECT_TRUE(db.execute("SELECT * FROM items").empty());
+}
+
+TEST_F(DatabaseTest, ExecuteManyThrowsOnConstraintViolation) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)");
+
+    EXPECT_THROW(db.execute_many("INSERT INTO items (name) VALUES (?)", {{psr::Value{"a"}}, {psr::Value{"a"}}}),
+                 std::runtime_error);
+    EXPECT_THROW(db.execute_many("INVALID SQL STATEMENT", {{}}), std::runtime_error);
+
+    // The failed batch is rolled back as a whole and the statement remains usable
+    EXPECT_TRUE(db.execute("SELECT * FROM items").empty());
+    db.execute_many("INSERT INTO items (name) VALUES (?)", {{psr::Value{"b"}}});
+    EXPECT_EQ(db.execute("SELECT * FROM items WHERE name = 'b'").row_count(), 1u);
+}
+
+TEST_F(DatabaseTest, ExecuteManyInsideTransaction) {
+    psr::Database db(test_db_path_);
+
+    db.execute("CREATE TABLE numbers (n INTEGER)");
+
+    // The batch nests inside an explicit transaction
+    db.begin_transaction();
+    db.execute_many("INSERT INTO numbers (n) VALUES (?)", {{psr::Value{int64_t{1}}}, {psr::Value{int64_t{2}}}});
+    EXPECT_EQ(db.execute("SELECT * FROM numbers").row_count(), 2u);
+    db.rollback();
+
+    EXPECT_TRUE(db.execute("SELECT * FROM numbers").empty());
+
+    db.execute_many("INSERT INTO numbers (n) VALUES (?)", {{psr::Value{int64_t{3}}}, {psr::Value{int64_t{4}}}});
+    EXPECT_EQ(db.execute("SELECT * FROM numbers").row_count(), 2u);
+}
+
+TEST_F(DatabaseTest, ExecuteManyFailureInsideTransaction) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)");
+
+    db.begin_transaction();
+    db.execute("INSERT INTO items (id) VALUES (1)");
+
+    // The failed batch is undone as a whole while the caller's earlier work and transaction survive
+    EXPECT_THROW(db.execute_many("INSERT INTO items (id) VALUES (?)",
+                                 {{psr::Value{int64_t{2}}}, {psr::Value{int64_t{3}}}, {psr::Value{int64_t{1}}}}),
+                 std::runtime_error);
+    EXPECT_EQ(db.execute("SELECT COUNT(*) FROM items")[0].get_int(0), 1);
+    db.commit();
+
+    EXPECT_EQ(db.execute("SELECT COUNT(*) FROM items")[0].get_int(0), 1);
+}
+
+TEST_F(DatabaseTest, BusyConnectionWaitsForLock) {
+    psr::Database writer(test_db_path_, psr::LogLevel::off);
+    writer.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)");
+    psr::Database other(test_db_path_, psr::LogLevel::off);
+
+    writer.begin_transaction();
+    writer.execute("INSERT INTO items (id) VALUES (1)");
+    std::thread release([&writer] {
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        writer.commit();
+    });
+
+    // Blocks in the busy handler until the writer commits instead of failing with "database is locked"
+    EXPECT_NO_THROW(other.execute("INSERT INTO items (id) VALUES (2)"));
+    release.join();
+    EXPECT_EQ(other.execute("SELECT COUNT(*) FROM items")[0].get_int(0), 2);
+}
+
+TEST_F(DatabaseTest, ManyDistinctQueries) {
+    psr::Database db(":memory:");
+
+    db.execute("CREATE TABLE numbers (n INTEGER)");
+    db.execute("INSERT INTO numbers (n) VALUES (1)");
+
+    // More distinct statements than the statement cache holds
+    for (int i = 0; i < 100; ++i) {
+        auto result = db.execute("SELECT n + " + std::to_string(i) + " FROM numbers");
+        EXPECT_EQ(result[0].get_int(0), 1 + i);
+    }
+
+    auto result = db.execute("SELECT n + 0 FROM numbers");
+    EXPECT_EQ(result[0].get_int(0), 1);
+}
+
+TEST_F(DatabaseTest, CreateElementSeesSchemaChangesFromOtherConnections) {
+    psr::Database db(test_db_path_, psr::LogLevel::off);
+    db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)");
+    db.create_element("items", {{"label", std::string("a")}});
+
+    {
+        psr::Database other(test_db_path_, psr::LogLevel::off);
+        other.execute("ALTER TABLE items ADD COLUMN price REAL");
+    }
+
+    // The cached insert plan is rebuilt, so the new column is type-checked
+    EXPECT_THROW(db.create_element("items", {{"label", std::string("b")}, {"price", std::string("cheap")}}),
+                 std::runtime_error);
+    EXPECT_EQ(db.create_element("items", {{"label", std::string("c")}, {"price", 1.5}}), 2);
+}
+
 // Migration tests
 class MigrationTest : public ::testing::Test {
 protected:
     void SetUp() override {
-        test_db_path_ = (fs::temp_directory_path() / "psr_migration_test.db").string();
-        test_schema_path_ = fs::temp_directory_path() / "psr_test_schema";
+        test_db_path_ = (psr_test::temp_directory() / "psr_migration_test.db").string();
+        test_schema_path_ = psr_test::temp_directory() / "psr_test_schema";
 
         // Clean up from previous runs
         if (fs::exists(test_db_path_)) {
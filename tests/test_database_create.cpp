@@ -7,6 +7,7 @@
  */
 
 #include "psr/database.h"
+#include "test_utils.h"
 
 #include <filesystem>
 #include <fstream>
@@ -89,7 +90,7 @@ class TestDatabaseHelper {
 public:
     TestDatabaseHelper(const std::string& schema_name)
         : schema_path_(get_test_schema_path(schema_name)),
-          db_path_(fs::temp_directory_path() / ("test_" + schema_name + ".sqlite")) {
+          db_path_(psr_test::temp_directory() / ("test_" + schema_name + ".sqlite")) {
         // Remove old database if exists
         if (fs::exists(db_path_)) {
             fs::remove(db_path_);
@@ -66,3 +66,17 @@ TEST(RowTest, BlobValue) {
     EXPECT_EQ((*result)[0], 0xDE);
     EXPECT_EQ((*result)[3], 0xEF);
 }
+
+TEST(RowTest, StringView) {
+    std::vector<psr::Value> values = {std::string{"hello"}, int64_t{1}, nullptr};
+    psr::Row row(std::move(values));
+
+    auto view = row.get_string_view(0);
+    ASSERT_TRUE(view.has_value());
+    EXPECT_EQ(*view, "hello");
+    EXPECT_EQ(view->data(), std::get<std::string>(row[0]).data());
+
+    EXPECT_FALSE(row.get_string_view(1).has_value());
+    EXPECT_FALSE(row.get_string_view(2).has_value());
+    EXPECT_FALSE(row.get_string_view(10).has_value());
+}
@@ -0,0 +1,27 @@
+#ifndef PSR_DATABASE_TEST_UTILS_H
+#define PSR_DATABASE_TEST_UTILS_H
+
+#include <filesystem>
+#include <system_error>
+
+#ifdef __linux__
+#include <unistd.h>
+#endif
+
+namespace psr_test {
+
+// Directory for on-disk test databases.
+// Prefers tmpfs (/dev/shm) on Linux so journal syncs are memory copies instead of disk flushes.
+inline std::filesystem::path temp_directory() {
+#ifdef __linux__
+    std::error_code ec;
+    if (std::filesystem::is_directory("/dev/shm", ec) && access("/dev/shm", W_OK) == 0) {
+        return "/dev/shm";
+    }
+#endif
+    return std::filesystem::temp_directory_path();
+}
+
+}  // namespace psr_test
+
+#endif  // PSR_DATABASE_TEST_UTILS_H